@@ -1,11 +1,11 @@
-from flask import Flask, request
+from flask import Flask
 from flask_migrate import Migrate
 from flask_restx import Api
 
 from .config import config
 from .utils.database import db
+from .utils.serialization import output_json
 from .routes.api import ns as api_namespace
-from .utils.validation import validate_id
 
 
 def create_app(config_name='development'):
@@ -29,14 +29,8 @@ def create_app(config_name='development'):
     )
 
     # Add namespaces
+    # (ID path segments are validated by the <int:...> URL converters)
     api.add_namespace(api_namespace)
-
-    # Register middleware
-    @app.before_request
-    def validate_ids():
-        if request.view_args:
-            ids = [v for k, v in request.view_args.items() if 'id' in k]
-            if ids:
-                validate_id(*ids)
+    api.representation('application/json')(output_json)
 
     return app
@@ -1,5 +1,6 @@
 import os
 from dotenv import load_dotenv
+from sqlalchemy.pool import StaticPool
 
 # Load environment variables from .env file
 load_dotenv()
@@ -9,6 +10,10 @@ class Config:
     """Base configuration with common settings"""
     SECRET_KEY = os.getenv('SECRET_KEY')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Larger compiled-statement cache so every endpoint/filter combination stays compiled
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'query_cache_size': 1200
+    }
 
     @staticmethod
     def init_app(app):
@@ -32,6 +37,13 @@ class TestConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Every session and request shares the one in-memory connection, so the schema is
+    # created once and the per-test transactions all see the same database
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        **Config.SQLALCHEMY_ENGINE_OPTIONS,
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False}
+    }
     SECRET_KEY = os.getenv('TEST_SECRET_KEY', 'test-key-fallback')
 
 
@@ -1,6 +1,20 @@
+import functools
+
 from app.utils.database import db
 
 
+@functools.lru_cache(maxsize=1024)
+def split_semicolon_list(value):
+    """Split a semicolon-delimited column into a tuple of stripped, non-empty items.
+
+    Memoized on the column value itself, so a cached result can never go stale the
+    way a per-instance cache would when the column is reassigned or refreshed.
+    """
+    if not value:
+        return ()
+    return tuple(filter(None, map(str.strip, value.split(';'))))
+
+
 class BaseModel(db.Model):
     __abstract__ = True
     created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
@@ -1,3 +1,6 @@
+from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import object_session
+
 from app.utils.database import db
 
 
@@ -13,7 +16,7 @@ class Course(db.Model):
     schedule = db.Column(db.String(250))
 
     # Relationships
-    department_id = db.Column(db.Integer, db.ForeignKey('departments.department_id'))
+    department_id = db.Column(db.Integer, db.ForeignKey('departments.department_id', ondelete='SET NULL'))
     department = db.relationship('Department', back_populates='courses')
     offerings = db.relationship('CourseOffering', back_populates='course')
 
@@ -37,6 +40,24 @@ class Course(db.Model):
         return [enrollment for enrollment in self.enrollments 
                 if enrollment.status == 'active']
 
+    @property
+    def student_count(self):
+        """Number of active enrollments in this course's offerings"""
+        if hasattr(self, '_precomputed_student_count'):
+            return self._precomputed_student_count
+        session = object_session(self)
+        if (session is None or hasattr(self, '_precomputed_active_enrollments')
+                or 'offerings' not in inspect(self).unloaded):
+            return len(self.active_enrollments)
+        # Count in the database rather than loading every offering and enrollment
+        from app.models.course_offering import CourseOffering
+        from app.models.enrollment import Enrollment
+        return session.scalar(
+            select(func.count(Enrollment.enrollment_id))
+            .join(CourseOffering)
+            .where(CourseOffering.course_id == self.course_id, Enrollment.status == 'active')
+        )
+
     def to_dict(self, include_stats=True, detailed=False):
         result = {
             "course_id": self.course_id,
@@ -96,11 +117,7 @@ class Course(db.Model):
             })
         
         elif include_stats:
-            if hasattr(self, '_precomputed_student_count'):
-                result["student_count"] = self._precomputed_student_count
-            else:
-                # Fallback to property-based computation
-                result["student_count"] = len(self.active_enrollments)
+            result["student_count"] = self.student_count
 
             if hasattr(self, '_precomputed_lecturer_count'):
                 result["lecturer_count"] = self._precomputed_lecturer_count
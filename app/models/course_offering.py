@@ -13,7 +13,8 @@ class CourseOffering(db.Model):
     # Correct Relationships
     course = db.relationship('Course', back_populates='offerings')
     lecturer = db.relationship('Lecturer', back_populates='offerings')
-    enrollments = db.relationship('Enrollment', back_populates='offering')
+    # Deleted with the offering; ON DELETE CASCADE covers deletes that bypass the session
+    enrollments = db.relationship('Enrollment', back_populates='offering', cascade='all, delete')
 
     def to_dict(self):
         return {
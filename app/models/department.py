@@ -1,4 +1,5 @@
 from app.utils.database import db
+from app.models.base import split_semicolon_list
 
 
 class Department(db.Model):
@@ -10,11 +11,18 @@ class Department(db.Model):
     research_areas = db.Column(db.String(250))
 
     # Relationships
+    # Members outlive their department: the ORM nulls their department_id, as
+    # ON DELETE SET NULL does for deletes that bypass the session
     courses = db.relationship('Course', back_populates='department')
     programs = db.relationship('Program', back_populates='department')
     lecturers = db.relationship('Lecturer', back_populates='department')
     staff_members = db.relationship('NonAcademicStaff', back_populates='department')
 
+    @property
+    def research_areas_list(self):
+        """Parse research areas into list"""
+        return list(split_semicolon_list(self.research_areas))
+
     def to_dict(self, include_stats=True, detailed=False):
         result = {
             "department_id": self.department_id,
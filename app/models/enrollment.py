@@ -6,8 +6,8 @@ class Enrollment(db.Model):
     __tablename__ = 'enrollments'
 
     enrollment_id = db.Column(db.Integer, primary_key=True)
-    student_id = db.Column(db.Integer, db.ForeignKey('students.student_id'), nullable=False)
-    offering_id = db.Column(db.Integer, db.ForeignKey('course_offerings.offering_id'), nullable=False)
+    student_id = db.Column(db.Integer, db.ForeignKey('students.student_id', ondelete='CASCADE'), nullable=False)
+    offering_id = db.Column(db.Integer, db.ForeignKey('course_offerings.offering_id', ondelete='CASCADE'), nullable=False)
     enrollment_date = db.Column(db.Date, server_default=func.now())
     grade = db.Column(db.Float)
     status = db.Column(db.String(20), default='active')  # active, completed, failed, withdrawn
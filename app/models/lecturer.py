@@ -1,4 +1,8 @@
+from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import object_session
+
 from app.utils.database import db
+from app.models.base import split_semicolon_list
 
 
 class Lecturer(db.Model):
@@ -16,7 +20,7 @@ class Lecturer(db.Model):
     publications = db.Column(db.Text)
 
     # Relationships
-    department_id = db.Column(db.Integer, db.ForeignKey('departments.department_id'))
+    department_id = db.Column(db.Integer, db.ForeignKey('departments.department_id', ondelete='SET NULL'))
     department = db.relationship('Department', back_populates='lecturers')
     offerings = db.relationship('CourseOffering', back_populates='lecturer')
     advisees = db.relationship('Student', back_populates='advisor')
@@ -31,10 +35,34 @@ class Lecturer(db.Model):
             'offering'
         ).filter_by(lecturer_id=self.lecturer_id).all()
     
+    @property
+    def areas_of_expertise_list(self):
+        """Parse areas of expertise into list"""
+        return list(split_semicolon_list(self.areas_of_expertise))
+
+    @property
+    def research_interests_list(self):
+        """Parse research interests into list"""
+        return list(split_semicolon_list(self.research_interests))
+
+    @property
+    def publications_list(self):
+        """Parse publications into list"""
+        return list(split_semicolon_list(self.publications))
+
     @property
     def current_course_load(self):
         """Current number of course offerings"""
-        return len(self.offerings)
+        if hasattr(self, '_precomputed_course_load'):
+            return self._precomputed_course_load
+        session = object_session(self)
+        if session is None or 'offerings' not in inspect(self).unloaded:
+            return len(self.offerings)
+        # Count in the database rather than loading every offering just for its length
+        from app.models.course_offering import CourseOffering
+        return session.scalar(
+            select(func.count(CourseOffering.offering_id)).where(CourseOffering.lecturer_id == self.lecturer_id)
+        )
 
     def to_dict(self, include_stats=True, detailed=False):
         result = {
@@ -113,10 +141,7 @@ class Lecturer(db.Model):
             })
         
         if include_stats:
-            if hasattr(self, '_precomputed_course_load'):
-                result["course_load"] = self._precomputed_course_load
-            else:
-                result["course_load"] = self.current_course_load
+            result["course_load"] = self.current_course_load
         
         return result
 
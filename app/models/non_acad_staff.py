@@ -10,7 +10,7 @@ class NonAcademicStaff(db.Model):
     employment_type = db.Column(db.String(100), nullable=False)
 
     # Relationships
-    department_id = db.Column(db.Integer, db.ForeignKey('departments.department_id'))
+    department_id = db.Column(db.Integer, db.ForeignKey('departments.department_id', ondelete='SET NULL'))
     department = db.relationship('Department', back_populates='staff_members')
 
     @property
@@ -12,7 +12,7 @@ class Program(db.Model):
     enrollment_details = db.Column(db.String(250))
 
     # Relationships
-    department_id = db.Column(db.Integer, db.ForeignKey('departments.department_id'))
+    department_id = db.Column(db.Integer, db.ForeignKey('departments.department_id', ondelete='SET NULL'))
     department = db.relationship('Department', back_populates='programs')
     students = db.relationship('Student', back_populates='program')
 
@@ -1,4 +1,5 @@
 from app.utils.database import db
+from app.models.base import split_semicolon_list
 
 
 class ResearchProject(db.Model):
@@ -29,6 +30,11 @@ class ResearchProject(db.Model):
             return self._precomputed_outcomes
         return self.outcomes.split(';') if self.outcomes else []
 
+    @property
+    def funding_sources_list(self):
+        """Parse funding sources into list"""
+        return list(split_semicolon_list(self.funding_sources))
+
     def to_dict(self):
         return {
             "project_id": self.project_id,
@@ -19,7 +19,8 @@ class Student(db.Model):
     # Relationships
     enrolled_program_id = db.Column(db.Integer, db.ForeignKey('programs.program_id'))
     program = db.relationship('Program', back_populates='students')
-    enrollments = db.relationship('Enrollment', back_populates='student')
+    # Deleted with the student; ON DELETE CASCADE covers deletes that bypass the session
+    enrollments = db.relationship('Enrollment', back_populates='student', cascade='all, delete')
     advisor_id = db.Column(db.Integer, db.ForeignKey('lecturers.lecturer_id'))
     advisor = db.relationship('Lecturer', back_populates='advisees')
 
@@ -15,7 +15,8 @@ from .api_resources import (
     CoursesList, CourseDetail,
     EnrollmentsList,
     DepartmentsList, DepartmentDetail,
-    StaffList
+    StaffList,
+    HealthCheck
 )
 
 
@@ -254,3 +255,15 @@ class StaffListEndpoint(StaffList):
     def get(self):
         """List non-academic staff with optional filtering."""
         return super().get(ns, models)
+
+
+# Health Endpoint
+@ns.route('/health')
+class HealthCheckEndpoint(HealthCheck):
+    """API health check endpoint."""
+
+    @ns.response(200, 'Success', models['health_model'])
+    @ns.marshal_with(models['health_model'])
+    def get(self):
+        """Report that the API is up."""
+        return super().get(ns, models)
@@ -322,6 +322,14 @@ def create_models(ns):
         'department': fields.String(description='Affiliated department')
     })
 
+    # ======================
+    # Health Models
+    # ======================
+
+    health_model = ns.model('Health', {
+        'status': fields.String(description='Service status')
+    })
+
     return {
         'student_model': student_model,
         'student_enrollment_detail_model': student_enrollment_detail_model,
@@ -348,5 +356,6 @@ def create_models(ns):
         'program_in_department_model': program_in_department_model,
         'staff_in_department_model': staff_in_department_model,
         'department_detail_model': department_detail_model,
-        'staff_model': staff_model
+        'staff_model': staff_model,
+        'health_model': health_model
     }
@@ -6,12 +6,15 @@ and their corresponding HTTP methods. Each resource handles specific entity oper
 and includes comprehensive error handling and validation.
 """
 
+import operator
+
 from flask import request
 from flask_restx import Resource
 from datetime import datetime, date
 from sqlalchemy import func
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import HTTPException
 
 from app.models import (
     Student, Lecturer, Course, Department, Program, Enrollment, 
@@ -20,16 +23,105 @@ from app.models import (
 from app.utils.database import db
 
 
+# =============
+# Declarative Query Filters
+# =============
+
+# Comparison operators available to filter specs
+_FILTER_OPERATORS = {
+    'eq': operator.eq,
+    'ge': operator.ge,
+    'le': operator.le,
+    'ilike': lambda column, value: column.ilike(f"%{value}%"),
+}
+
+# Filter specs: (query parameter, column, operator, parameter type)
+STUDENT_FILTERS = (
+    ('year', Student.year_of_study, 'eq', int),
+    ('min_grade', Student.current_grades, 'ge', float),
+    ('max_grade', Student.current_grades, 'le', float),
+    ('program_id', Student.enrolled_program_id, 'eq', int),
+)
+
+LECTURER_FILTERS = (
+    ('department_id', Lecturer.department_id, 'eq', int),
+    ('expertise_area', Lecturer.areas_of_expertise, 'ilike', str),
+    ('research_area', Lecturer.research_interests, 'ilike', str),
+    ('employment_type', Lecturer.employment_type, 'ilike', str),
+    ('min_course_load', Lecturer.course_load, 'ge', int),
+    ('max_course_load', Lecturer.course_load, 'le', int),
+)
+
+COURSE_FILTERS = (
+    ('department_id', Course.department_id, 'eq', int),
+    ('level', Course.level, 'ilike', str),
+    ('min_credits', Course.credits, 'ge', int),
+    ('max_credits', Course.credits, 'le', int),
+)
+
+ENROLLMENT_FILTERS = (
+    ('student_id', Enrollment.student_id, 'eq', int),
+    ('status', Enrollment.status, 'ilike', str),
+)
+
+STAFF_FILTERS = (
+    ('department_id', NonAcademicStaff.department_id, 'eq', int),
+    ('job_title', NonAcademicStaff.job_title, 'ilike', str),
+    ('employment_type', NonAcademicStaff.employment_type, 'ilike', str),
+)
+
+
+def parse_filters(filters):
+    """Parse the query parameters of the filter specs present in the request, by name.
+
+    A range bound of 0 is a real bound; for the other operators a 0 or empty
+    value means "no filter", e.g. ``department_id=0`` lists every department.
+    """
+    values = {}
+    for name, _column, op, value_type in filters:
+        value = request.args.get(name, type=value_type)
+        if value is None or (not value and op not in ('ge', 'le')):
+            continue
+        values[name] = value
+    return values
+
+
+def apply_filters(query, filters, values=None):
+    """Apply every filter spec whose query parameter is present in the request.
+
+    Pass the result of parse_filters as values when the caller has already parsed
+    the parameters (e.g. to validate them), so each one is read only once.
+    """
+    if values is None:
+        values = parse_filters(filters)
+    for name, column, op, _value_type in filters:
+        if name in values:
+            query = query.filter(_FILTER_OPERATORS[op](column, values[name]))
+    return query
+
+
+def precompute_course_loads(lecturers):
+    """Attach offering counts to lecturers with one grouped query instead of loading offerings."""
+    lecturer_ids = [l.lecturer_id for l in lecturers]
+    counts = dict(db.session.query(
+        CourseOffering.lecturer_id,
+        func.count(CourseOffering.offering_id)
+    ).filter(CourseOffering.lecturer_id.in_(lecturer_ids)).group_by(CourseOffering.lecturer_id).all())
+
+    for lecturer in lecturers:
+        lecturer._precomputed_course_load = counts.get(lecturer.lecturer_id, 0)
+
+
 class StudentsList(Resource):
     """Resource for handling multiple students operations."""
     
     def get(self, ns, models):
         """List students with optional filtering."""
         # Parse query parameters
-        year = request.args.get('year', type=int)
-        min_grade = request.args.get('min_grade', type=float)
-        max_grade = request.args.get('max_grade', type=float)
-        program_id = request.args.get('program_id', type=int)
+        filter_values = parse_filters(STUDENT_FILTERS)
+        year = filter_values.get('year')
+        min_grade = filter_values.get('min_grade')
+        max_grade = filter_values.get('max_grade')
         department_id = request.args.get('department_id', type=int)
         graduation_status = request.args.get('graduation_status')
         unregistered = request.args.get('unregistered', '').lower() == 'true'
@@ -58,14 +150,7 @@ class StudentsList(Resource):
             )
 
             # Apply filters
-            if year:
-                query = query.filter(Student.year_of_study == year)
-            if min_grade is not None:
-                query = query.filter(Student.current_grades >= min_grade)
-            if max_grade is not None:
-                query = query.filter(Student.current_grades <= max_grade)
-            if program_id:
-                query = query.filter(Student.enrolled_program_id == program_id)
+            query = apply_filters(query, STUDENT_FILTERS, filter_values)
             if department_id:
                 query = query.join(Program).filter(Program.department_id == department_id)
             if graduation_status is not None:
@@ -100,6 +185,9 @@ class StudentsList(Resource):
         except SQLAlchemyError as e:
             db.session.rollback()
             ns.abort(500, f"Database error: {str(e)}")
+        except HTTPException:
+            # Let the 400/404 aborts raised above through as they are
+            raise
         except Exception as e:
             ns.abort(500, f"Unexpected error: {str(e)}")
 
@@ -110,12 +198,12 @@ class StudentDetail(Resource):
     def get(self, student_id, ns, models):
         """Get detailed information about a specific student."""
         try:
-            student = db.session.query(Student).options(
+            student = db.session.get(Student, student_id, options=[
                 selectinload(Student.program).selectinload(Program.department),
                 selectinload(Student.advisor).selectinload(Lecturer.department),
                 selectinload(Student.enrollments).selectinload(Enrollment.offering).selectinload(CourseOffering.course),
                 selectinload(Student.enrollments).selectinload(Enrollment.offering).selectinload(CourseOffering.lecturer)
-            ).filter(Student.student_id == student_id).first()
+            ])
 
             if not student:
                 ns.abort(404, f"Student with ID {student_id} not found")
@@ -134,9 +222,9 @@ class StudentAdvisor(Resource):
     def get(self, student_id, ns, models):
         """Get advisor information for a specific student."""
         try:
-            student = db.session.query(Student).options(
+            student = db.session.get(Student, student_id, options=[
                 selectinload(Student.advisor).selectinload(Lecturer.department)
-            ).filter(Student.student_id == student_id).first()
+            ])
 
             if not student:
                 ns.abort(404, f"Student with ID {student_id} not found")
@@ -156,12 +244,6 @@ class LecturersList(Resource):
     
     def get(self, ns, models):
         """List lecturers with optional filtering."""
-        department_id = request.args.get('department_id', type=int)
-        expertise_area = request.args.get('expertise_area')
-        research_area = request.args.get('research_area')
-        employment_type = request.args.get('employment_type')
-        min_course_load = request.args.get('min_course_load', type=int)
-        max_course_load = request.args.get('max_course_load', type=int)
         top_supervisors = request.args.get('top_supervisors', '').lower() == 'true'
         limit = request.args.get('limit', default=100, type=int)
         offset = request.args.get('offset', default=0, type=int)
@@ -192,6 +274,8 @@ class LecturersList(Resource):
                 if not lecturers:
                     ns.abort(404, "No research supervisors found")
 
+                precompute_course_loads([l[0] for l in lecturers])
+
                 return [{
                     **l[0].to_dict(),
                     "projects_count": l[1],
@@ -200,33 +284,26 @@ class LecturersList(Resource):
 
             # Standard filtering with eager loading
             query = db.session.query(Lecturer).options(
-                selectinload(Lecturer.department),
-                selectinload(Lecturer.offerings)
+                selectinload(Lecturer.department)
             )
 
-            if department_id:
-                query = query.filter(Lecturer.department_id == department_id)
-            if expertise_area:
-                query = query.filter(Lecturer.areas_of_expertise.ilike(f"%{expertise_area}%"))
-            if research_area:
-                query = query.filter(Lecturer.research_interests.ilike(f"%{research_area}%"))
-            if employment_type:
-                query = query.filter(Lecturer.employment_type.ilike(f"%{employment_type}%"))
-            if min_course_load is not None:
-                query = query.filter(Lecturer.course_load >= min_course_load)
-            if max_course_load is not None:
-                query = query.filter(Lecturer.course_load <= max_course_load)
+            query = apply_filters(query, LECTURER_FILTERS)
 
             lecturers = query.offset(offset).limit(limit).all()
 
             if not lecturers:
                 ns.abort(404, "No lecturers found matching the criteria")
 
+            precompute_course_loads(lecturers)
+
             return [l.to_dict() for l in lecturers]
 
         except SQLAlchemyError as e:
             db.session.rollback()
             ns.abort(500, f"Database error: {str(e)}")
+        except HTTPException:
+            # Let the 400/404 aborts raised above through as they are
+            raise
         except Exception as e:
             ns.abort(500, f"Unexpected error: {str(e)}")
 
@@ -237,14 +314,14 @@ class LecturerDetail(Resource):
     def get(self, lecturer_id, ns, models):
         """Get detailed information about a specific lecturer."""
         try:
-            lecturer = db.session.query(Lecturer).options(
+            lecturer = db.session.get(Lecturer, lecturer_id, options=[
                 selectinload(Lecturer.department),
                 selectinload(Lecturer.research_projects),
-                selectinload(Lecturer.research_group),
+                selectinload(Lecturer.research_group).selectinload(ResearchProject.principal_investigator),
                 selectinload(Lecturer.offerings).selectinload(CourseOffering.course),
                 selectinload(Lecturer.offerings).selectinload(CourseOffering.enrollments),
                 selectinload(Lecturer.advisees).selectinload(Student.program)
-            ).filter(Lecturer.lecturer_id == lecturer_id).first()
+            ])
 
             if not lecturer:
                 ns.abort(404, f"Lecturer with ID {lecturer_id} not found")
@@ -287,10 +364,6 @@ class CoursesList(Resource):
     
     def get(self, ns, models):
         """List courses with optional filtering."""
-        department_id = request.args.get('department_id', type=int)
-        level = request.args.get('level')
-        min_credits = request.args.get('min_credits', type=int)
-        max_credits = request.args.get('max_credits', type=int)
         lecturer_id = request.args.get('lecturer_id', type=int)
         student_id = request.args.get('student_id', type=int)
         limit = request.args.get('limit', default=100, type=int)
@@ -308,17 +381,10 @@ class CoursesList(Resource):
             # Build optimized query
             query = db.session.query(Course).options(
                 selectinload(Course.department),
-                selectinload(Course.offerings)
+                selectinload(Course.offerings).selectinload(CourseOffering.enrollments)
             )
 
-            if department_id:
-                query = query.filter(Course.department_id == department_id)
-            if level:
-                query = query.filter(Course.level.ilike(f"%{level}%"))
-            if min_credits is not None:
-                query = query.filter(Course.credits >= min_credits)
-            if max_credits is not None:
-                query = query.filter(Course.credits <= max_credits)
+            query = apply_filters(query, COURSE_FILTERS)
             if lecturer_id:
                 query = query.filter(Course.offerings.any(lecturer_id=lecturer_id))
             if student_id:
@@ -337,6 +403,9 @@ class CoursesList(Resource):
         except SQLAlchemyError as e:
             db.session.rollback()
             ns.abort(500, f"Database error: {str(e)}")
+        except HTTPException:
+            # Let the 400/404 aborts raised above through as they are
+            raise
         except Exception as e:
             ns.abort(500, f"Unexpected error: {str(e)}")
 
@@ -347,7 +416,10 @@ class CourseDetail(Resource):
     def get(self, course_code, ns, models):
         """Get detailed information about a specific course."""
         try:
-            course = db.session.query(Course).filter(Course.code == course_code.upper()).first()
+            course = db.session.query(Course).options(
+                selectinload(Course.offerings).selectinload(CourseOffering.enrollments).selectinload(Enrollment.student),
+                selectinload(Course.offerings).selectinload(CourseOffering.lecturer).selectinload(Lecturer.department)
+            ).filter(Course.code == course_code.upper()).first()
 
             if not course:
                 ns.abort(404, f"Course with code {course_code} not found")
@@ -365,11 +437,9 @@ class EnrollmentsList(Resource):
     def get(self, ns, models):
         """List enrollments with optional filtering."""
         course_code = request.args.get('course_code')
-        student_id = request.args.get('student_id', type=int)
         lecturer_id = request.args.get('lecturer_id', type=int)
         semester = request.args.get('semester')
         year = request.args.get('year', type=int)
-        status = request.args.get('status')
         from_date = request.args.get('from_date')
         to_date = request.args.get('to_date')
         has_grade = request.args.get('has_grade')
@@ -394,18 +464,15 @@ class EnrollmentsList(Resource):
             )
 
             # Apply filters
+            query = apply_filters(query, ENROLLMENT_FILTERS)
             if course_code:
                 query = query.filter(Enrollment.offering.has(CourseOffering.course.has(code=course_code.upper())))
-            if student_id:
-                query = query.filter(Enrollment.student_id == student_id)
             if lecturer_id:
                 query = query.filter(Enrollment.offering.has(lecturer_id=lecturer_id))
             if semester:
                 query = query.filter(Enrollment.offering.has(CourseOffering.semester.ilike(f"%{semester}%")))
             if year:
                 query = query.filter(Enrollment.offering.has(CourseOffering.year == year))
-            if status:
-                query = query.filter(Enrollment.status.ilike(f"%{status}%"))
 
             # Date range filtering
             if from_date:
@@ -438,6 +505,9 @@ class EnrollmentsList(Resource):
         except SQLAlchemyError as e:
             db.session.rollback()
             ns.abort(500, f"Database error: {str(e)}")
+        except HTTPException:
+            # Let the 400/404 aborts raised above through as they are
+            raise
         except Exception as e:
             ns.abort(500, f"Unexpected error: {str(e)}")
 
@@ -478,7 +548,12 @@ class DepartmentDetail(Resource):
     def get(self, department_id, ns, models):
         """Get detailed information about a specific department."""
         try:
-            department = db.session.query(Department).filter(Department.department_id == department_id).first()
+            department = db.session.get(Department, department_id, options=[
+                selectinload(Department.lecturers).selectinload(Lecturer.offerings),
+                selectinload(Department.courses),
+                selectinload(Department.programs).selectinload(Program.students),
+                selectinload(Department.staff_members)
+            ])
 
             if not department:
                 ns.abort(404, f"Department with ID {department_id} not found")
@@ -495,9 +570,6 @@ class StaffList(Resource):
     
     def get(self, ns, models):
         """List non-academic staff with optional filtering."""
-        department_id = request.args.get('department_id', type=int)
-        job_title = request.args.get('job_title')
-        employment_type = request.args.get('employment_type')
         limit = request.args.get('limit', default=100, type=int)
         offset = request.args.get('offset', default=0, type=int)
 
@@ -516,12 +588,7 @@ class StaffList(Resource):
             )
 
             # Apply filters
-            if department_id:
-                query = query.filter(NonAcademicStaff.department_id == department_id)
-            if job_title:
-                query = query.filter(NonAcademicStaff.job_title.ilike(f"%{job_title}%"))
-            if employment_type:
-                query = query.filter(NonAcademicStaff.employment_type.ilike(f"%{employment_type}%"))
+            query = apply_filters(query, STAFF_FILTERS)
 
             staff = query.offset(offset).limit(limit).all()
 
@@ -533,5 +600,16 @@ class StaffList(Resource):
         except SQLAlchemyError as e:
             db.session.rollback()
             ns.abort(500, f"Database error: {str(e)}")
+        except HTTPException:
+            # Let the 400/404 aborts raised above through as they are
+            raise
         except Exception as e:
             ns.abort(500, f"Unexpected error: {str(e)}")
+
+
+class HealthCheck(Resource):
+    """Resource for checking that the API is up."""
+
+    def get(self, ns, models):
+        """Report service status without touching the database."""
+        return {"status": "ok"}
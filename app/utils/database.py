@@ -1,9 +1,24 @@
+import sqlite3
+from contextlib import contextmanager
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy_utils import database_exists, create_database
 
 
 db = SQLAlchemy()
 
+
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite ignores foreign keys, ON DELETE rules included, unless asked per connection
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 def init_db(app):
     """Initialize database and tables programmatically"""
     with app.app_context():
@@ -34,3 +49,46 @@ def init_db(app):
 
         db.create_all()
         print("✅ Database tables READY")
+
+
+@contextmanager
+def relaxed_sqlite_durability():
+    """Turn off fsync and the on-disk rollback journal for a bulk load on SQLite.
+
+    Must be entered inside an app context. Other dialects are left untouched;
+    the previous PRAGMA values are restored on exit.
+
+    Both PRAGMAs are per connection, and a commit inside the block hands the
+    session's connection back to the pool. The settings are therefore applied
+    to and restored on the session's underlying DBAPI connection itself, not
+    on whichever connection the session checks out next.
+    """
+    if db.engine.dialect.name != 'sqlite':
+        yield
+        return
+
+    dbapi_connection = db.session.connection().connection.dbapi_connection
+    synchronous = _sqlite_pragma(dbapi_connection, "synchronous")
+    journal_mode = _sqlite_pragma(dbapi_connection, "journal_mode")
+    _sqlite_pragma(dbapi_connection, "synchronous=OFF")
+    _sqlite_pragma(dbapi_connection, "journal_mode=MEMORY")
+    try:
+        yield
+    except BaseException:
+        # SQLite refuses to change the safety level inside the failed transaction
+        db.session.rollback()
+        raise
+    finally:
+        _sqlite_pragma(dbapi_connection, f"synchronous={synchronous}")
+        _sqlite_pragma(dbapi_connection, f"journal_mode={journal_mode}")
+
+
+def _sqlite_pragma(dbapi_connection, pragma):
+    # Fetch every row and close the cursor, so no statement is left in progress
+    # to block the session's next COMMIT
+    cursor = dbapi_connection.cursor()
+    try:
+        rows = cursor.execute(f"PRAGMA {pragma}").fetchall()
+    finally:
+        cursor.close()
+    return rows[0][0] if rows else None
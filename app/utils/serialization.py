@@ -0,0 +1,25 @@
+"""JSON encoding for API responses, using orjson when it is installed."""
+
+from flask import current_app, make_response
+from flask_restx.representations import output_json as restx_output_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def output_json(data, code, headers=None):
+    """Flask-RESTx ``application/json`` representation encoded with orjson.
+
+    Falls back to Flask-RESTx's own encoder when orjson is not installed, or when
+    RESTX_JSON is configured (its settings are ``json.dumps`` keyword arguments).
+    """
+    if orjson is None or current_app.config.get('RESTX_JSON'):
+        return restx_output_json(data, code, headers)
+
+    option = orjson.OPT_INDENT_2 if current_app.debug else 0
+    # Same trailing newline as the Flask-RESTx encoder
+    resp = make_response(orjson.dumps(data, option=option) + b"\n", code)
+    resp.headers.extend(headers or {})
+    return resp
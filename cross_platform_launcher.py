@@ -1,54 +1,187 @@
+import atexit
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 import sys
 import time
-import webbrowser
-from flask import Flask
-import requests
 from colorama import init, Fore, Back, Style
-import psutil
 import signal
+import socket
 import os
 import platform
+import select
+import shlex
+import shutil
+import tempfile
+from urllib.parse import urljoin, urlsplit
 
 
+# Platform checks, resolved once at import
+_SYSTEM = platform.system()
+_IS_WIN = sys.platform.startswith('win')
+
 # Initialize colorama with proper encoding
-init(strip=False, convert=sys.platform.startswith('win'), autoreset=True)
+init(strip=False, convert=_IS_WIN, autoreset=True)
 
 # Force color support in non-TTY environments
 os.environ['FORCE_COLOR'] = '1'
 
+# Environment for setup subprocesses, built once: force UTF-8 for Python children
+_child_env = os.environ.copy()
+_child_env['PYTHONIOENCODING'] = 'utf-8'
+
+# ANSI sequences materialized once as plain strings, plus reusable line templates
+GREEN, RED, YELLOW, CYAN = str(Fore.GREEN), str(Fore.RED), str(Fore.YELLOW), str(Fore.CYAN)
+MAGENTA, BLACK, BLUE = str(Fore.MAGENTA), str(Fore.BLACK), str(Fore.BLUE)
+BG_WHITE, DIM, BRIGHT, RESET = str(Back.WHITE), str(Style.DIM), str(Style.BRIGHT), str(Style.RESET_ALL)
+
+_OK_TMPL = GREEN + "✓ %s" + RESET
+_FAIL_TMPL = RED + "✗ %s" + RESET
+_STEP_TMPL = "\n" + CYAN + "[Step %d/%d] %s" + RESET + "\n"
+
 temp_files_to_cleanup = []
 
+# Heavier third-party modules are imported on first use, so showing the menu
+# (or exiting from it) doesn't pay for them
+_psutil = None
+_proc_cache = {}  # pid -> psutil.Process, reused across port scans
+_requests = None
+_session = None
+_probe_session = None
+
+_DOWNLOAD_CHUNK = 1 << 20  # 1 MiB
+
+def _get_psutil():
+    global _psutil
+    if _psutil is None:
+        import psutil as _psutil
+    return _psutil
+
+def _get_requests():
+    global _requests
+    if _requests is None:
+        import requests as _requests
+    return _requests
+
+def _get_session():
+    """Pooled HTTP session for the (100MB+) PowerShell archive download."""
+    global _session
+    if _session is None:
+        from requests.adapters import HTTPAdapter
+        _session = _get_requests().Session()
+        _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return _session
+
+def _get_probe_session():
+    """Keep-alive session shared by the readiness probes, closed when the launcher exits."""
+    global _probe_session
+    if _probe_session is None:
+        _probe_session = _get_requests().Session()
+        _probe_session.headers['Connection'] = 'keep-alive'
+        atexit.register(_probe_session.close)
+    return _probe_session
+
+# Persistent PowerShell bootstrap for the Flask debug terminal; launch-specific
+# values are passed as parameters so pwsh only has to run a small -File invocation
+BOOT_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bundled_powershell", "urms_boot.ps1")
+BOOT_SCRIPT_SOURCE = """param(
+    [string]$VenvPath,
+    [string]$VenvPython,
+    [string]$WorkDir
+)
+
+# Configure console for Unicode support
+$OutputEncoding = [System.Text.Encoding]::UTF8
+[Console]::OutputEncoding = [System.Text.Encoding]::UTF8
+[Console]::InputEncoding = [System.Text.Encoding]::UTF8
+# Only use chcp on Windows
+if ($env:OS -eq 'Windows_NT') { chcp 65001 | Out-Null }
+
+Write-Host "===================================================================" -ForegroundColor Cyan
+Write-Host "======= ~      Uni-Records-Management-Sys (URMS) APP      ~ =======" -ForegroundColor Cyan
+Write-Host "===================================================================" -ForegroundColor Cyan
+Write-Host ""
+Write-Host "Flask-RESTx (with Swagger UI)" -ForegroundColor Gray
+Write-Host ""
+
+# Activate the virtual environment for this terminal
+$env:VIRTUAL_ENV = Split-Path -Parent $VenvPath
+$env:PATH = $VenvPath + [IO.Path]::PathSeparator + $env:PATH
+
+Set-Location -LiteralPath $WorkDir
+& $VenvPython run.py
+"""
+
+# Interactive pwsh flags and the bootstrap's parameters (in order: script, venv
+# scripts dir, venv python, work dir), shared by every platform's launch command
+_PWSH_FLAGS = ("-NoLogo", "-NoExit", "-NoProfile")
+_PWSH_FLAGS_STR = " ".join(_PWSH_FLAGS)
+_BOOT_PARAM_NAMES = ("-File", "-VenvPath", "-VenvPython", "-WorkDir")
+
+def _windows_powershell_locations():
+    """Canonical install locations, keyed by executable name, checked before searching PATH."""
+    program_dirs = dict.fromkeys(
+        d for d in (os.environ.get('ProgramFiles', r'C:\Program Files'), os.environ.get('ProgramW6432')) if d
+    )
+    system_root = os.environ.get('SystemRoot', r'C:\Windows')
+    return {
+        "pwsh": [os.path.join(d, "PowerShell", "7", "pwsh.exe") for d in program_dirs],
+        "powershell.exe": [os.path.join(system_root, "System32", "WindowsPowerShell", "v1.0", "powershell.exe")],
+    }
+
+@functools.lru_cache(maxsize=1)
 def get_system_powershell_path():
     """Check if PowerShell is already installed on the system and return its path."""
-    system = platform.system()
-
-    def pathfind_command(cmd):
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=2)
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip().split("\n")[0]  # Get first path
-            return None
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return None
-
-    # Determine commands to check in priority order - PowerShell Core preferred
-    commands = []
-    if system == "Windows":
-        commands.append(("where", "pwsh", "PowerShell Core"))
-        commands.append(("where", "powershell.exe", "Windows PowerShell"))
-    else:
-        commands.append(("which", "pwsh", "PowerShell Core"))
-
-    # Check each command in order of priority
-    for cmd_name, executable, pwsh_type in commands:
-        path = pathfind_command([cmd_name, executable])
+    # Executables to look up in priority order - PowerShell Core preferred
+    candidates = [("pwsh", "PowerShell Core")]
+    well_known = {}
+    if _SYSTEM == "Windows":
+        candidates.append(("powershell.exe", "Windows PowerShell"))
+        well_known = _windows_powershell_locations()
+
+    for executable, pwsh_type in candidates:
+        # A stat on the usual install location is far cheaper than a PATH search
+        path = next((p for p in well_known.get(executable, ()) if os.path.isfile(p)), None) or shutil.which(executable)
         if path:
-            print(f"\n{Fore.GREEN}✓ {pwsh_type} found on system: [\x1b[3m{Fore.MAGENTA}{path}{Style.RESET_ALL}{Fore.GREEN}].{Style.RESET_ALL}\nProceeding...\n")
+            print(f"\n{GREEN}✓ {pwsh_type} found on system: [\x1b[3m{MAGENTA}{path}{RESET}{GREEN}].{RESET}\nProceeding...\n")
             return path
 
     return None
 
+@functools.lru_cache(maxsize=1)
+def find_linux_terminal():
+    """Return the first installed terminal emulator (falling back to xterm), resolved once per run."""
+    terminals = ["gnome-terminal", "konsole", "xterm", "xfce4-terminal", "terminator"]
+    return next((t for t in terminals if shutil.which(t)), "xterm")
+
+def extract_zip_parallel(archive_path, dest_dir):
+    """Extract a zip archive with one worker per CPU; each entry is an independent deflate stream."""
+    import zipfile
+
+    with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+        members = zip_ref.infolist()
+        root = os.path.realpath(dest_dir) + os.sep
+        # Create the directory tree up front so workers never race on makedirs;
+        # entries that would land outside dest_dir (absolute or ../ paths) are refused
+        for member in members:
+            target = os.path.realpath(os.path.join(root, member.filename))
+            if not (target + os.sep).startswith(root):
+                raise ValueError(f"Refusing to extract {member.filename!r} outside {dest_dir}")
+            os.makedirs(target if member.is_dir() else os.path.dirname(target), exist_ok=True)
+
+        files = [member for member in members if not member.is_dir()]
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+            # list() re-raises the first extraction error, if any
+            list(executor.map(lambda member: zip_ref.extract(member, dest_dir), files))
+
+def extract_tarball(archive_path, dest_dir):
+    """Extract a .tar.gz archive, refusing members that would land outside dest_dir."""
+    import tarfile
+
+    with tarfile.open(archive_path, 'r:gz') as tar_ref:
+        # The 'data' filter rejects absolute paths, ../ escapes and links out of dest_dir
+        tar_ref.extractall(dest_dir, filter='data')
+
 def download_powershell_if_needed():
     """Download PowerShell Core only if not already available on the system."""
     # Check if PowerShell is already installed on the system
@@ -56,11 +189,8 @@ def download_powershell_if_needed():
     if system_path:
         return system_path
     
-    import zipfile
-    import tarfile
-    
     # Determine platform and architecture
-    system = platform.system()
+    system = _SYSTEM
     architecture = "x64" if platform.machine().endswith('64') else "x86"
     
     # Set up download URLs and paths
@@ -70,10 +200,10 @@ def download_powershell_if_needed():
     # Check if already downloaded
     bundled_path = os.path.join(ps_dir, "pwsh.exe" if system == "Windows" else "pwsh")
     if os.path.exists(bundled_path):
-        print(f"\n{Fore.GREEN}✓ PowerShell Core (bundled) found on system: [\x1b[3m{Fore.MAGENTA}{bundled_path}{Style.RESET_ALL}{Fore.GREEN}].{Style.RESET_ALL}\nProceeding...\n")
+        print(f"\n{GREEN}✓ PowerShell Core (bundled) found on system: [\x1b[3m{MAGENTA}{bundled_path}{RESET}{GREEN}].{RESET}\nProceeding...\n")
         return bundled_path
     
-    print(f"\n{Fore.YELLOW}### Hurdle (minor): no PowerShell installation found ###{Style.RESET_ALL}\n")
+    print(f"\n{YELLOW}### Hurdle (minor): no PowerShell installation found ###{RESET}\n")
     
     # PowerShell Core download URLs (latest version)
     ps_urls = {
@@ -88,18 +218,18 @@ def download_powershell_if_needed():
         
         # Download file
         print(f"Downloading PowerShell Core for {system}...")
-        response = requests.get(url, stream=True)
-        with open(local_file, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        with _get_session().get(url, stream=True, timeout=(5, 30)) as response:
+            response.raise_for_status()
+            # Copy straight from the raw stream in 1 MiB blocks, bypassing iter_content
+            response.raw.decode_content = True
+            with open(local_file, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=_DOWNLOAD_CHUNK)
         
         # Extract archive
         if local_file.endswith('.zip'):
-            with zipfile.ZipFile(local_file, 'r') as zip_ref:
-                zip_ref.extractall(ps_dir)
+            extract_zip_parallel(local_file, ps_dir)
         else:
-            with tarfile.open(local_file, 'r:gz') as tar_ref:
-                tar_ref.extractall(ps_dir)
+            extract_tarball(local_file, ps_dir)
         
         # Make executable on Unix systems
         if system != "Windows":
@@ -107,16 +237,17 @@ def download_powershell_if_needed():
         
         # Cleanup download file
         os.remove(local_file)
-        print(f"{Fore.GREEN}✓ PowerShell Core installed successfully{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}  ➥ now available on system at: [\x1b[3m{Fore.MAGENTA}{bundled_path}{Style.RESET_ALL}{Fore.GREEN}].{Style.RESET_ALL}\nProceeding...\n")
+        print(_OK_TMPL % "PowerShell Core installed successfully")
+        print(f"{GREEN}  ➥ now available on system at: [\x1b[3m{MAGENTA}{bundled_path}{RESET}{GREEN}].{RESET}\nProceeding...\n")
         
         return bundled_path
     
-    print(f"\n{Fore.RED}✗ Unsupported system: {system}{Style.RESET_ALL}\n")
+    print(f"\n{RED}✗ Unsupported system: {system}{RESET}\n")
     return None
 
+@functools.lru_cache(maxsize=1)
 def get_powershell_path():
-    """Get path to PowerShell executable (system or bundled)."""
+    """Get path to PowerShell executable (system or bundled), resolved once per launcher run."""
     # Check for system PowerShell first
     system_path = get_system_powershell_path()
     if system_path:
@@ -131,7 +262,7 @@ def run_powershell_script(script):
     pwsh_path = get_powershell_path()
     
     if not pwsh_path:
-        print(f"{Fore.RED}✗ PowerShell is not available and could not be installed{Style.RESET_ALL}")
+        print(_FAIL_TMPL % "PowerShell is not available and could not be installed")
         return None, None, 1
     
     # Execute PowerShell script
@@ -141,131 +272,125 @@ def run_powershell_script(script):
     
     return result.stdout, result.stderr, result.returncode
 
+def ensure_boot_script():
+    """Write the PowerShell bootstrap script on first run (or when it is out of date)."""
+    try:
+        with open(BOOT_SCRIPT_PATH, 'r', encoding='utf-8') as f:
+            if f.read() == BOOT_SCRIPT_SOURCE:
+                return BOOT_SCRIPT_PATH
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(os.path.dirname(BOOT_SCRIPT_PATH), exist_ok=True)
+    with open(BOOT_SCRIPT_PATH, 'w', encoding='utf-8') as f:
+        f.write(BOOT_SCRIPT_SOURCE)
+    return BOOT_SCRIPT_PATH
+
+def _emit(msg):
+    """Write one status line in a single call; flushing is left to the caller (or the next print)."""
+    sys.stdout.write(msg + '\n')
+
 def print_step(step_number, total_steps, message):
     """Print a formatted step message with progress indicator."""
-    print(f"\n{Fore.CYAN}[Step {step_number}/{total_steps}] {message}{Style.RESET_ALL}\n")
+    print(_STEP_TMPL % (step_number, total_steps, message))
 
 def run_command(command, cwd=None):
-    """Run a command and stream its output."""
-    startupinfo = None
-    if sys.platform.startswith('win'):
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        
-    process = subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        shell=True,
-        cwd=cwd,
-        encoding='utf-8',
-        env={**os.environ, 'PYTHONIOENCODING': 'utf-8'},  # Force UTF-8 for Python subprocess
-        startupinfo=startupinfo
-    )
+    """Run a command without a shell and stream its stdout and stderr as they arrive.
 
-    while True:
-        output = process.stdout.readline()
-        if output == '' and process.poll() is not None:
-            break
-        if output:
-            print(output.strip(), flush=True)
-            
-    rc = process.poll()
-    return rc
+    Returns the exit code, or 1 when the command cannot be started at all.
+    """
+    if isinstance(command, str):
+        command = shlex.split(command)
+
+    try:
+        process = subprocess.Popen(
+            command,
+            bufsize=0,  # unbuffered pipes: output is drained straight from the fds below
+            stdout=subprocess.PIPE,
+            # select() cannot wait on pipes on Windows, so stderr is folded into stdout there
+            stderr=subprocess.STDOUT if _IS_WIN else subprocess.PIPE,
+            cwd=cwd,
+            env=_child_env,
+            creationflags=subprocess.CREATE_NO_WINDOW if _IS_WIN else 0
+        )
+    except OSError as e:
+        # No shell in between, so a missing executable surfaces here rather than as exit code 127
+        print(_FAIL_TMPL % f"Could not run {command[0]}: {e}")
+        return 1
+
+    # Forward raw output in 64 KiB chunks instead of decoding it line by line
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    pipes = [process.stdout] if _IS_WIN else [process.stdout, process.stderr]
+    while pipes:
+        ready = pipes if _IS_WIN else select.select(pipes, [], [], 0.1)[0]
+        for pipe in ready:
+            chunk = os.read(pipe.fileno(), 65536)
+            if chunk:
+                out.write(chunk)
+            else:
+                pipes.remove(pipe)
+        out.flush()
+
+    return process.wait()
+
+def start_flask_application(pwsh_path, wait=True):
+    """Start the Flask application with RESTx and Swagger UI.
 
-def start_flask_application():
-    """Start the Flask application with RESTx and Swagger UI."""
+    pwsh_path is the PowerShell executable resolved by main() (None falls back
+    to the system terminal). With wait=False the terminal is launched and control returns immediately,
+    so the caller can overlap other work with the server warmup and call
+    wait_for_flask() itself.
+    """
     # Ensure no process is running on port 5000
     kill_process_on_port(5000)
 
     print("Waiting for Flask-RESTx (with Swagger UI) to start...")
     
     # Get virtual environment paths
-    venv_path = os.path.join(os.getcwd(), ".venv", "Scripts" if sys.platform.startswith('win') else "bin")
-    venv_python = os.path.join(venv_path, "python.exe" if sys.platform.startswith('win') else "python")
+    venv_path = os.path.join(os.getcwd(), ".venv", "Scripts" if _IS_WIN else "bin")
+    venv_python = os.path.join(venv_path, "python.exe" if _IS_WIN else "python")
     if not os.path.exists(venv_python):
-        print(f"{Fore.RED}✗ Virtual environment Python not found at {venv_python}{Style.RESET_ALL}\n")
+        print(f"{RED}✗ Virtual environment Python not found at {venv_python}{RESET}\n")
         sys.exit(1)
     
-    # Set environment variables for the new terminal
-    powershell_env_setup = (
-        "$env:VIRTUAL_ENV='" + os.path.dirname(venv_path).replace("'", "''") + "';",
-        "$env:PATH='" + venv_path.replace("'", "''") + "' + [IO.Path]::PathSeparator + $env:PATH;"
-        )
-    
     # Launch Flask-RESTx debugger in a new terminal window
     try:
-        # Get PowerShell path via detection
-        pwsh_path = get_powershell_path()
-
         if pwsh_path:
             # PowerShell is available (either system or downloaded)
-            powershell_cmd = (
-                # Configure console for Unicode support
-                '$OutputEncoding = [System.Text.Encoding]::UTF8;' +
-                '[Console]::OutputEncoding = [System.Text.Encoding]::UTF8;' +
-                '[Console]::InputEncoding = [System.Text.Encoding]::UTF8;' +
-                # Only use chcp on Windows
-                ('' if not sys.platform.startswith('win') else 'chcp 65001 | Out-Null;') +
-                f'Write-Host "===================================================================" -ForegroundColor Cyan;' +
-                f'Write-Host "======= ~      Uni-Records-Management-Sys (URMS) APP      ~ =======" -ForegroundColor Cyan;' +
-                f'Write-Host "===================================================================" -ForegroundColor Cyan;' +
-                f'Write-Host "";' +
-                f'Write-Host "Flask-RESTx (with Swagger UI)" -ForegroundColor Gray;' +
-                f'Write-Host "";' +
-                ''.join(powershell_env_setup) +
-                f'cd "{os.getcwd()}";' +
-                f'& "{venv_python}" run.py'
-            )
-            
-            if sys.platform.startswith('win'):
-                temp_script = os.path.join(os.environ.get('TEMP', os.getcwd()), 'urms_launch.ps1')
-                with open(temp_script, 'w', encoding='utf-8') as f:
-                    f.write(powershell_cmd)
-                temp_files_to_cleanup.append(temp_script)
-
-                cmd = f'start "" "{pwsh_path}" -NoLogo -NoExit -NoProfile -ExecutionPolicy Bypass -File "{temp_script}"'
+            boot_params = list(zip(_BOOT_PARAM_NAMES, (ensure_boot_script(), venv_path, venv_python, os.getcwd())))
+            boot_argv = [part for param in boot_params for part in param]
+            boot_args = " ".join(f'{name} "{value}"' for name, value in boot_params)
 
-                subprocess.Popen(cmd, shell=True)
+            if _IS_WIN:
+                # Argv list straight to CreateProcess; a new console replaces `start` via cmd.exe
+                subprocess.Popen(
+                    [pwsh_path, *_PWSH_FLAGS, "-ExecutionPolicy", "Bypass", *boot_argv],
+                    creationflags=subprocess.CREATE_NEW_CONSOLE
+                )
 
             elif sys.platform == "darwin":  # macOS
-                temp_script = os.path.join(os.path.expanduser("~/Library/Caches"), 'urms_launch.ps1')
-                with open(temp_script, 'w', encoding='utf-8') as f:
-                    f.write(powershell_cmd)
-                temp_files_to_cleanup.append(temp_script)
-
-                # Make it executable
-                os.chmod(temp_script, 0o755)
-
                 # Use AppleScript to open Terminal with PowerShell executing the script
+                escaped_args = boot_args.replace('"', '\\"')
                 apple_script = (
                     f'tell application "Terminal" to do script '
-                    f'"{pwsh_path} -NoLogo -NoExit -NoProfile -File \\"{temp_script}\\""'
+                    f'"{pwsh_path} {_PWSH_FLAGS_STR} {escaped_args}"'
                     )
                 
                 subprocess.Popen(['osascript', '-e', apple_script])
 
             else:  # Linux
-                temp_script = os.path.join("/tmp", 'urms_launch.ps1')
-                with open(temp_script, 'w', encoding='utf-8') as f:
-                    f.write(powershell_cmd)
-                temp_files_to_cleanup.append(temp_script)
-                
-                # Make it executable
-                os.chmod(temp_script, 0o755)
-
                 # Create a shell wrapper script that launches PowerShell with our script
-                wrapper_script = os.path.join("/tmp", 'urms_launch.sh')
-                with open(wrapper_script, 'w', encoding='utf-8') as f:
-                    f.write(f'#!/bin/bash\n{pwsh_path} -NoLogo -NoExit -NoProfile -File "{temp_script}"\n')
+                fd, wrapper_script = tempfile.mkstemp(suffix='.sh', prefix='urms_launch_')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(f'#!/bin/bash\n"{pwsh_path}" {_PWSH_FLAGS_STR} {boot_args}\n')
                 temp_files_to_cleanup.append(wrapper_script)
 
-                # Make it executable
+                # Make it executable (mkstemp creates it 0600)
                 os.chmod(wrapper_script, 0o755)
 
                 # Find a suitable terminal emulator
-                terminals = ["gnome-terminal", "konsole", "xterm", "xfce4-terminal", "terminator"]
-                terminal_cmd = next((t for t in terminals if subprocess.run(["which", t], capture_output=True).returncode == 0), "xterm")
+                terminal_cmd = find_linux_terminal()
                 
                 # Different terminals have different command line syntax
                 if terminal_cmd == "gnome-terminal":
@@ -273,142 +398,269 @@ def start_flask_application():
                 else:
                     subprocess.Popen([terminal_cmd, '-e', wrapper_script])
             
-            print(f"{Fore.GREEN}✓ Launched Standalone Debug Terminal using PowerShell{Style.RESET_ALL}\n")
+            print(f"{GREEN}✓ Launched Standalone Debug Terminal using PowerShell{RESET}\n")
         else:
             # Fallback to system default terminal if PowerShell is not available (untested)
-            print(f"{Fore.YELLOW}PowerShell not available, using system terminal (untested)...{Style.RESET_ALL}\n")
-            if sys.platform.startswith('win'):
-                subprocess.Popen(['start', 'cmd', '/k', f'cd /d {os.getcwd()} && {venv_python} run.py'], shell=True)
+            print(f"{YELLOW}PowerShell not available, using system terminal (untested)...{RESET}\n")
+            if _IS_WIN:
+                subprocess.Popen(['cmd', '/k', venv_python, 'run.py'], cwd=os.getcwd(),
+                                 creationflags=subprocess.CREATE_NEW_CONSOLE)
             elif sys.platform == "darwin":
                 subprocess.Popen(['open', '-a', 'Terminal', f'cd {os.getcwd()} && python run.py'])
             else:  # Linux
                 #Find a suitable terminal emulator
-                terminals = ["gnome-terminal", "konsole", "xterm", "xfce4-terminal", "terminator"]
-                terminal_cmd = next((t for t in terminals if subprocess.run(["which", t], capture_output=True).returncode == 0), "xterm")
+                terminal_cmd = find_linux_terminal()
                 
                 subprocess.Popen([terminal_cmd, '--', 'python', 'run.py'])
-                print(f"{Fore.RED}✗ No suitable terminal emulator found. Please run the Flask app manually.{Style.RESET_ALL}\n")
+                print(f"{RED}✗ No suitable terminal emulator found. Please run the Flask app manually.{RESET}\n")
                 sys.exit(1)
 
     except Exception as e:
-        print(f"{Fore.RED}✗ Failed to launch Standalone Debug Terminal: {str(e)}{Style.RESET_ALL}\n")
+        print(f"{RED}✗ Failed to launch Standalone Debug Terminal: {str(e)}{RESET}\n")
         sys.exit(1)
     
-    # Wait for Flask to be ready
+    if wait:
+        ensure_flask_ready()
+
+def ensure_flask_ready():
+    """Block until the Flask server answers, exiting the launcher if it never does."""
     if not wait_for_flask():
-        print(f"{Fore.RED}✗ Flask server failed to start{Style.RESET_ALL}\n")
+        print(f"{RED}✗ Flask server failed to start{RESET}\n")
         sys.exit(1)
 
-def wait_for_flask(url="http://localhost:5000/", max_attempts=30):
-    """Wait for Flask server and Swagger UI to be ready."""
-    print("...check external window...")
-    attempt = 0
-    while attempt < max_attempts:
+def _probe_endpoints(checks):
+    """HEAD every url in checks concurrently; True when each answers with one of its accepted statuses."""
+    requests = _get_requests()
+    session = _get_probe_session()
+
+    def probe(item):
+        url, accepted = item
         try:
-            response = requests.get(url)
-            if response.status_code in [200, 404]:
-                print(f"{Fore.GREEN}✓ Flask-RESTx (with Swagger UI) is ready!{Style.RESET_ALL}")
-                return True
-        except requests.exceptions.ConnectionError:
-            pass
-        
-        time.sleep(1)
-        attempt += 1
-        sys.stdout.write('.')
-        sys.stdout.flush()
+            return session.head(url, timeout=0.25, allow_redirects=False).status_code in accepted
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            return False
+
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        return all(executor.map(probe, checks.items()))
+
+def wait_for_flask(url="http://localhost:5000/", timeout=30, docs_path="/api/docsNdemo"):
+    """Wait for Flask server and Swagger UI to be ready.
+
+    Polls the port with cheap TCP connects (backing off from 50ms by 1.5x,
+    capped at 100ms). Once something is listening, the root URL and the
+    Swagger UI page are probed concurrently to confirm it is this Flask app;
+    the wait is bounded by the slower probe, not their sum. Gives up after
+    timeout seconds.
+    """
+    print("...check external window...", flush=True)
+    target = urlsplit(url)
+    address = (target.hostname, target.port or 80)
+    checks = {url: (200, 404)}
+    if docs_path:
+        checks[urljoin(url, docs_path)] = (200,)
+    deadline = time.monotonic() + timeout
+    next_dot = time.monotonic() + 1
+    delay = 0.05
+    while time.monotonic() < deadline:
+        try:
+            # Resolves the host itself, so 'localhost' works whether Flask bound IPv4 or IPv6
+            with socket.create_connection(address, timeout=0.2):
+                listening = True
+        except OSError:  # refused, timed out or unreachable
+            listening = False
+
+        if listening and _probe_endpoints(checks):
+            print(_OK_TMPL % "Flask-RESTx (with Swagger UI) is ready!")
+            return True
+
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.1)
+        if time.monotonic() >= next_dot:
+            next_dot += 1
+            os.write(1, b'.')  # unbuffered, skips the TextIOWrapper lock
     
     return False
 
-def kill_process_on_port(port):
-    """Kill any process running on the specified port."""
-    for proc in psutil.process_iter(['pid', 'name']):
+def is_port_free(port):
+    """Return True if the port can be bound, i.e. nothing is listening on it."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        try:
+            probe.bind(('', port))
+            return True
+        except OSError:
+            return False
+
+def find_pid_on_port(port):
+    """Find the PID owning the given local port with a single system-wide connection sweep."""
+    psutil = _get_psutil()
+    try:
+        connections = psutil.net_connections(kind='tcp')
+    except psutil.AccessDenied:
+        # macOS needs root for the system-wide table; fall back to per-process lookups
+        return find_pid_on_port_per_process(port)
+
+    for conn in connections:
+        if conn.laddr and conn.laddr.port == port and conn.pid:
+            return conn.pid
+    return None
+
+def find_pid_on_port_per_process(port):
+    """Find the PID owning the given local port by inspecting each accessible process."""
+    psutil = _get_psutil()
+    pids = psutil.pids()
+    # Forget processes that have exited since the previous scan
+    for stale_pid in _proc_cache.keys() - set(pids):
+        del _proc_cache[stale_pid]
+
+    for pid in pids:
         try:
-            for conn in proc.net_connections():
-                if conn.laddr.port == port:
-                    os.kill(proc.pid, signal.SIGTERM)
-                    time.sleep(1)  # Give it time to shutdown gracefully
-                    return
+            proc = _proc_cache.get(pid)
+            if proc is None or not proc.is_running():
+                proc = _proc_cache[pid] = psutil.Process(pid)
+            with proc.oneshot():
+                for conn in proc.net_connections(kind='tcp'):
+                    if conn.laddr and conn.laddr.port == port:
+                        return pid
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
+    return None
 
-def check_migrations_folder_nonempty():
-    """Check if the migrations folder exists and is not empty."""
-    migrations_folder = os.path.join(os.getcwd(), "migrations")
-    if not os.path.isdir(migrations_folder):
+def wait_for_process_exit(pid, timeout):
+    """Wait up to timeout seconds for a (non-child) process to exit; True if it has."""
+    # Linux 5.3+: a pidfd becomes readable the moment the process exits
+    if hasattr(os, 'pidfd_open'):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pidfd = None  # kernel without pidfd support
+        if pidfd is not None:
+            try:
+                return bool(select.select([pidfd], [], [], timeout)[0])
+            finally:
+                os.close(pidfd)
+
+    psutil = _get_psutil()
+    try:
+        psutil.Process(pid).wait(timeout=timeout)
+    except psutil.NoSuchProcess:
+        pass
+    except psutil.TimeoutExpired:
         return False
+    return True
 
-    has_files = False
-    has_versions_dir = False
+def kill_process_on_port(port):
+    """Kill any process running on the specified port."""
+    # On Linux a successful bind proves the port is free, skipping the connection sweep
+    if _SYSTEM == "Linux" and is_port_free(port):
+        return
 
-    for entry in os.scandir(migrations_folder):
-        if entry.is_file():
-            has_files = True
-        elif entry.is_dir() and entry.name == "versions":
-            has_versions_dir = True
+    pid = find_pid_on_port(port)
+    if pid is None:
+        return
 
-    return has_files and has_versions_dir
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        return
+
+    # Give it up to a second to shut down gracefully, returning as soon as it exits
+    if not wait_for_process_exit(pid, 1.0) and hasattr(signal, 'SIGKILL'):
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+def check_migrations_folder_nonempty():
+    """Check that `flask db init` produced a migrations folder (alembic.ini plus versions/)."""
+    migrations_folder = os.path.join(os.getcwd(), "migrations")
+    # versions/ may legitimately be empty: autogenerate writes no revision when the
+    # tables created by the running app already match the models
+    return (os.path.isfile(os.path.join(migrations_folder, "alembic.ini"))
+            and os.path.isdir(os.path.join(migrations_folder, "versions")))
 
 def open_web_browser():
-    """Open the API documentation in a web browser."""
-    webbrowser.open('http://localhost:5000/api/docsNdemo')
+    """Open the API documentation in a web browser without blocking the launcher.
+
+    webbrowser can wait on the browser process to acknowledge, so it runs on a
+    background thread. The thread is deliberately non-daemon: the launcher exits
+    right after this, and a daemon thread could be killed before the browser starts.
+    """
+    import threading
+    import webbrowser
+
+    threading.Thread(target=webbrowser.open_new_tab, args=('http://localhost:5000/api/docsNdemo',)).start()
 
 def cleanup_temp_files():
     if not temp_files_to_cleanup:
-        print(f"\n{Fore.GREEN}✓ No temporary files to cleanup{Style.RESET_ALL}\n")
+        print(f"\n{GREEN}✓ No temporary files to cleanup{RESET}\n")
         return
     
     print(f"\n* Wrapping up: cleaning up temporary files...")
     success_count = 0
+    # The same path can be registered more than once; keep first-seen order
+    file_paths = list(dict.fromkeys(temp_files_to_cleanup))
 
-    for file_path in temp_files_to_cleanup:
+    for file_path in file_paths:
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                print(f"  - {file_path}")
-                success_count += 1
-            else:
-                # File doesn't exist, so we consider it already cleaned up
-                success_count += 1
-        except Exception as e:
-            print(f"{Fore.RED}✗ - {file_path}: {e}{Style.RESET_ALL}")
-
-    if success_count == len(temp_files_to_cleanup):
-        print(f"{Fore.GREEN}✓ Cleanup complete{Style.RESET_ALL}\n")
+            os.unlink(file_path)
+            _emit(f"  - {file_path}")
+            success_count += 1
+        except FileNotFoundError:
+            # File doesn't exist, so we consider it already cleaned up
+            success_count += 1
+        except OSError as e:
+            _emit(f"{RED}✗ - {file_path}: {e}{RESET}")
+
+    temp_files_to_cleanup.clear()
+
+    if success_count == len(file_paths):
+        print(f"{GREEN}✓ Cleanup complete{RESET}\n")
     else:
-        print(f"{Fore.YELLOW}⚠ Partial cleanup completed ({success_count}\n leftover files:{len(temp_files_to_cleanup)} files){Style.RESET_ALL}\n")
+        print(f"{YELLOW}⚠ Partial cleanup completed ({success_count}\n leftover files:{len(file_paths) - success_count} files){RESET}\n")
+
+@atexit.register
+def _cleanup_temp_files_at_exit():
+    """Remove temp files left behind when the launcher exits early (sys.exit, Ctrl-C)."""
+    if temp_files_to_cleanup:
+        cleanup_temp_files()
 
 def show_completion_message():
     """Show the final completion message to the user."""
-    print(f"\n{Fore.CYAN}The Flask server is running in a separate terminal window.{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}You can close that window when you're done with the application.{Style.RESET_ALL}")
+    _emit(
+        f"\n{CYAN}The Flask server is running in a separate terminal window.{RESET}\n"
+        f"{CYAN}You can close that window when you're done with the application.{RESET}"
+    )
+    sys.stdout.flush()
 
 def main():
     print(
-        f"\n{Fore.BLACK}{Back.WHITE}WELCOME TO "
-        f"{Fore.BLUE}Uni-Records-Management-Sys"
-        f"{Fore.BLACK} (URMS)!{Style.RESET_ALL}\n"
+        f"\n{BLACK}{BG_WHITE}WELCOME TO "
+        f"{BLUE}Uni-Records-Management-Sys"
+        f"{BLACK} (URMS)!{RESET}\n"
         f"\n"
-        f"\n{Fore.CYAN}----- Launcher -----{Style.RESET_ALL}\n"
+        f"\n{CYAN}----- Launcher -----{RESET}\n"
         f"\n"
-        f"{Fore.YELLOW}Select Option:\n"
-        f"{Fore.CYAN}  1. Setup\n"
-        f"{Fore.CYAN}  2. Application\n"
-        f"{Fore.CYAN}{Style.DIM}  0. Exit Launcher{Style.RESET_ALL}\n"
-        f"\n{Fore.CYAN}--------------------{Style.RESET_ALL}\n"
+        f"{YELLOW}Select Option:\n"
+        f"{CYAN}  1. Setup\n"
+        f"{CYAN}  2. Application\n"
+        f"{CYAN}{DIM}  0. Exit Launcher{RESET}\n"
+        f"\n{CYAN}--------------------{RESET}\n"
     )
 
     while True:
-        choice = input(f"{Fore.GREEN}Enter your choice (1, 2, or 0): {Style.RESET_ALL}").strip()
+        choice = input(f"{GREEN}Enter your choice (1, 2, or 0): {RESET}").strip()
 
         if choice not in ['1', '2', '0']:
-            print(f"{Fore.RED}✗ Invalid choice. Please enter 1, 2, or 0.{Style.RESET_ALL}")
+            print(_FAIL_TMPL % "Invalid choice. Please enter 1, 2, or 0.")
         elif choice == '0':
-            print(f"\n{Fore.MAGENTA}{Style.BRIGHT}Exiting Launcher. Goodbye!{Style.RESET_ALL}")
+            print(f"\n{MAGENTA}{BRIGHT}Exiting Launcher. Goodbye!{RESET}")
             sys.exit(0)
         elif choice == '2':
-            print(f"\n{Fore.CYAN}========== Uni-Records-Management-Sys APP =========={Style.RESET_ALL}\n")
+            print(f"\n{CYAN}========== Uni-Records-Management-Sys APP =========={RESET}\n")
 
-            start_flask_application()
+            start_flask_application(get_powershell_path())
             time.sleep(1)
             open_web_browser()
 
@@ -416,59 +668,50 @@ def main():
             show_completion_message()
             sys.exit(0)
         else:
-            print(f"\n{Fore.CYAN}========== Uni-Records-Management-Sys SETUP =========={Style.RESET_ALL}\n")
+            print(f"\n{CYAN}========== Uni-Records-Management-Sys SETUP =========={RESET}\n")
 
-            total_steps = 5
+            total_steps = 3
             current_step = 1
 
-            print_step(current_step, total_steps, "Starting Flask application with RESTx and Swagger UI")
-
-            start_flask_application() # Step 1
-
-            current_step += 1
-        
-            # Step 2: Initialize Flask-Migrate
-            print_step(current_step, total_steps, "Initializing Flask-Migrate")
-            if run_command("flask db init") != 0:
-                print(f"{Fore.RED}✗ Flask-Migrate initialization failed{Style.RESET_ALL}")
+            # Step 1: The schema is created and migrated before the server starts,
+            # so the server's own init_db never races the pipeline for it
+            print_step(current_step, total_steps, "Initializing migrations and creating the initial migration")
+            if run_command([sys.executable, "-m", "scripts.setup_pipeline", "migrate"]) != 0:
+                print(_FAIL_TMPL % "Database setup failed (see the step output above)")
                 sys.exit(1)
-            print(f"{Fore.GREEN}✓ Flask-Migrate initialized successfully (you can ignore the alembic.ini message){Style.RESET_ALL}")
-            time.sleep(2)
-            
-            current_step += 1
 
-            # Step 3: Create initial migration
-            print_step(current_step, total_steps, "Creating initial database migration")
-            if run_command('flask db migrate -m "Initial migration."') != 0:
-                print(f"{Fore.RED}✗ Database migration failed{Style.RESET_ALL}")
-                sys.exit(1)
-            
             # Verify migration creation
             if check_migrations_folder_nonempty():
-                print(f"{Fore.GREEN}✓ Database migration created successfully{Style.RESET_ALL}")
+                print(_OK_TMPL % "Database migration created successfully")
             else:
-                print(f"{Fore.RED}✗ Migration folder was not created{Style.RESET_ALL}")
+                print(_FAIL_TMPL % "Migration folder was not created")
                 sys.exit(1)
-            time.sleep(2)
 
             current_step += 1
 
-            # Step 4: Seed the database
-            print_step(current_step, total_steps, "Seeding the database with sample data (expanded)")
-            if run_command("python -m scripts.seed_database_expanded") != 0:
-                print(f"{Fore.RED}✗ Database seeding failed{Style.RESET_ALL}")
-                sys.exit(1)
-            print(f"{Fore.GREEN}✓ Database seeded successfully{Style.RESET_ALL}")
-            time.sleep(2)
+            # Step 2: Seeding only needs the app context, not the HTTP server,
+            # so it runs while the server warms up
+            print_step(current_step, total_steps, "Starting Flask application with RESTx and Swagger UI and seeding sample data")
+            start_flask_application(get_powershell_path(), wait=False)
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                seeding = executor.submit(run_command, [sys.executable, "-m", "scripts.setup_pipeline", "seed"])
+                ensure_flask_ready()
+
+                if seeding.result() != 0:
+                    print(_FAIL_TMPL % "Database seeding failed (see the step output above)")
+                    sys.exit(1)
+
+            print(_OK_TMPL % "Database seeded successfully")
 
             current_step += 1
 
-            # Step 5: Open API documentation
+            # Step 3: Open API documentation
             print_step(current_step, total_steps, "Opening API documentation in web browser")
             
             open_web_browser()
             
-            print(f"\n{Fore.GREEN}✓ ALL SETUP STEPS COMPLETED SUCCESSFULLY! ✓{Style.RESET_ALL}")
+            print(f"\n{GREEN}✓ ALL SETUP STEPS COMPLETED SUCCESSFULLY! ✓{RESET}")
 
             cleanup_temp_files()
             show_completion_message()
@@ -1,8 +1,24 @@
+import functools
+
 from app import create_app
 from app.utils.database import init_db
 
-app = create_app()
+
+@functools.lru_cache(maxsize=1)
+def get_app():
+    """Return the application, building it on first use and reusing it afterwards."""
+    return create_app()
+
+
+def __getattr__(name):
+    # `run.app` stays importable (gunicorn's run:app, `flask` via FLASK_APP, the seed
+    # scripts) without paying for app construction when run.py is merely imported
+    if name == 'app':
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == '__main__':
+    app = get_app()
     init_db(app)  # Pass app instance to init_db
     app.run(debug=True)
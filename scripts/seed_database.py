@@ -1,14 +1,13 @@
 from datetime import date
 
-from app import create_app
-from app.models import Department, Lecturer, Course, Student, Program, NonAcademicStaff, ResearchProject
-from app.utils.database import db
-
-app = create_app()
+from app.models import (Department, Lecturer, Course, CourseOffering, Enrollment, Student, Program,
+                        NonAcademicStaff, ResearchProject, project_team_members)
+from app.utils.database import db, relaxed_sqlite_durability
+from run import app  # reuse the app run.py builds instead of constructing a second one
 
 
 def create_test_data():
-    with app.app_context():
+    with app.app_context(), relaxed_sqlite_durability():
         # Clear existing data
         db.drop_all()
         db.create_all()
@@ -58,8 +57,7 @@ def create_test_data():
             description="Fundamentals of programming using Python",
             level="Undergraduate",
             credits=15,
-            department=cs_dept,
-            lecturers=[lecturer1]
+            department=cs_dept
         )
 
         course2 = Course(
@@ -68,8 +66,7 @@ def create_test_data():
             description="Common data structures and algorithms",
             level="Undergraduate",
             credits=20,
-            department=cs_dept,
-            lecturers=[lecturer1]
+            department=cs_dept
         )
 
         course3 = Course(
@@ -78,10 +75,16 @@ def create_test_data():
             description="Introduction to differential calculus",
             level="Foundation",
             credits=15,
-            department=math_dept,
-            lecturers=[lecturer2]
+            department=math_dept
         )
 
+        # ======================
+        # Create Course Offerings (who teaches what)
+        # ======================
+        offering1 = CourseOffering(course=course1, lecturer=lecturer1, semester="Fall", year=2024)
+        offering2 = CourseOffering(course=course2, lecturer=lecturer1, semester="Spring", year=2025)
+        offering3 = CourseOffering(course=course3, lecturer=lecturer2, semester="Fall", year=2024)
+
         # ======================
         # Create Programs
         # ======================
@@ -109,8 +112,7 @@ def create_test_data():
             year_of_study=4,
             current_grades=85.5,
             program=cs_program,
-            advisor=lecturer1,
-            courses=[course1, course2]
+            advisor=lecturer1
         )
 
         student2 = Student(
@@ -120,25 +122,7 @@ def create_test_data():
             year_of_study=3,
             current_grades=65.0,
             program=math_program,
-            advisor=lecturer2,
-            courses=[course3]
-        )
-
-        # ======================
-        # Create Staff
-        # ======================
-        staff1 = NonAcademicStaff(
-            name="Sarah Wilson",
-            job_title="Department Administrator",
-            employment_type="Full-Time",
-            department=cs_dept
-        )
-
-        staff2 = NonAcademicStaff(
-            name="Michael Brown",
-            job_title="Lab Technician",
-            employment_type="Part-Time",
-            department=math_dept
+            advisor=lecturer2
         )
 
         # ======================
@@ -148,7 +132,6 @@ def create_test_data():
             title="Advanced Machine Learning Techniques",
             funding_sources="UK Research Council",
             principal_investigator=lecturer1,
-            team_members=[lecturer1, lecturer2],
             outcomes="New ML framework;3 publications"
         )
 
@@ -159,16 +142,50 @@ def create_test_data():
             outcomes="New encryption algorithm"
         )
 
-        # Add all objects to session
+        # Phase 1: add every row that others reference and flush once, so the
+        # unit of work batches the INSERTs per table and primary keys are populated
         db.session.add_all([
             cs_dept, math_dept,
             lecturer1, lecturer2,
             course1, course2, course3,
+            offering1, offering2, offering3,
             cs_program, math_program,
             student1, student2,
-            staff1, staff2,
             project1, project2
         ])
+        db.session.flush()
+
+        # ======================
+        # Phase 2: leaf rows (nothing references them) as executemany batches
+        # ======================
+        enrollments = [
+            Enrollment(student_id=student1.student_id, offering_id=offering1.offering_id, status="active"),
+            Enrollment(student_id=student1.student_id, offering_id=offering2.offering_id, status="active"),
+            Enrollment(student_id=student2.student_id, offering_id=offering3.offering_id, status="active"),
+        ]
+
+        staff = [
+            NonAcademicStaff(
+                name="Sarah Wilson",
+                job_title="Department Administrator",
+                employment_type="Full-Time",
+                department_id=cs_dept.department_id
+            ),
+            NonAcademicStaff(
+                name="Michael Brown",
+                job_title="Lab Technician",
+                employment_type="Part-Time",
+                department_id=math_dept.department_id
+            ),
+        ]
+
+        db.session.bulk_save_objects(enrollments + staff)
+
+        # Research team membership goes straight into the association table
+        db.session.execute(project_team_members.insert(), [
+            {"project_id": project1.project_id, "lecturer_id": lecturer1.lecturer_id},
+            {"project_id": project1.project_id, "lecturer_id": lecturer2.lecturer_id},
+        ])
 
         db.session.commit()
 
@@ -9,24 +9,35 @@ and interconnected test data across all entities in the system.
 """
 
 from datetime import date, timedelta
+import functools
 import random
+import numpy as np
 import pandas as pd
 import os
 import json
 import sys
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import func, inspect, literal, select, update
 
-from app import create_app
 from app.models import (
     Department, Lecturer, Course, Student, CourseOffering,
-    Program, Enrollment, NonAcademicStaff, ResearchProject
+    Program, Enrollment, NonAcademicStaff, ResearchProject, project_team_members
 )
-from app.utils.database import db
+from app.utils.database import db, relaxed_sqlite_durability
+from run import app  # reuse the app run.py builds instead of constructing a second one
 
+try:
+    # orjson parses noticeably faster when installed; both accept the raw bytes
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
-# Initialize Flask application context
-app = create_app()
-#random.seed(42)  # Set fixed seed for reproducible results
+# Set SEED to a non-zero integer for reproducible test data; unset or 0 draws fresh data each run.
+# Draws use this instance, not the random module's global one; create_test_data's NumPy generator shares the seed.
+_SEED = int(os.environ.get('SEED', '0')) or None
+_RNG = random.Random(_SEED)
 
 
 def load_faculty_data() -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
@@ -42,8 +53,8 @@ def load_faculty_data() -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
         JSONDecodeError: If faculty data file contains invalid JSON
     """
     try:
-        with open(os.path.join('data', 'faculty_department_subject.json')) as f:
-            data = json.load(f)
+        with open(os.path.join('data', 'faculty_department_subject.json'), 'rb') as f:
+            data = json_loads(f.read())
             # Create both mappings in a single pass for efficiency
             faculty_departments: Dict[str, List[str]] = {}
             dept_subjects: Dict[str, List[str]] = {}
@@ -77,6 +88,97 @@ FACULTY_DEGREE_MAPPING = {
 }
 
 
+# Columns read from the people workbook
+PEOPLE_COLUMNS = ['First Name', 'Last Name', 'Email']
+
+# Value pools for the generated records, shared by every row instead of rebuilt per row
+RESEARCH_AREAS = (
+    "Artificial Intelligence", "Machine Learning",
+    "Ethics", "Education", "Interdisciplinary Studies",
+    "Policy", "Human-Computer Interaction",
+    "Psychology", "Philosophy", "Digital Transformation",
+    "Quantitative Methods", "Qualitative Research",
+    "Applied Research", "Sustainable Development"
+)
+
+QUALIFICATIONS = (
+    "PhD", "x2 PhD", "MPhil", "MRes",
+    "Masters", "x2 Masters", "DPhil"
+)
+
+CONTRACT_TYPES = (
+    "Tenure-track", "Tenured", "Visiting Professor",
+    "Fixed-term contract", "Research fellowship"
+)
+
+COURSE_NAME_PREFIXES = (
+    "Introduction to", "Advanced", "Principles of",
+    "Topics in", "Seminar in", "Fundamentals of",
+    "Theories of", "Research Methods in"
+)
+
+JOB_TITLES = (
+    "Administrator", "Secretary", "Lab Technician",
+    "IT Support", "Librarian", "Maintenance",
+    "Security Officer", "Careers Advisor"
+)
+
+PROJECT_OUTCOMES = (
+    "New international framework", "3 publications",
+    "Patent application", "Improved algorithm",
+    "United Nations advisory", "Educational software",
+    "Conference presentation", "Industry partnership"
+)
+
+PROJECT_TITLE_PREFIXES = (
+    "Advanced Research in", "Study of", "Investigation into",
+    "Development of", "Analysis of", "Applications of", "Review of",
+    "Exploration of", "Impact of", "Trends in", "Future of"
+)
+
+PROJECT_SUBJECTS = (
+    "Machine Learning", "Artificial Intelligence", "Interdisciplinary Studies",
+    "Global Digital Infrastructure", "World Sustainability", "Marcusian Studies",
+    "Global Security", "Climate Change", "Academic Evolution", "European Union",
+    "[redacted] - CLASSIFIED RESEARCH", "Educational Technology", "Smart University Initiative (SUI)"
+)
+
+EMPLOYMENT_TYPES = ("Full-Time", "Part-Time", "Contract")
+
+LECTURER_PUBLICATIONS = (
+    "Journal publications; Conference papers",
+    "Journal publications", "Books; Book chapters",
+    "Patents; Technical reports"
+)
+
+PROJECT_PUBLICATIONS = (
+    "Journal publications; Conference papers",
+    "Journal publications",
+    "Patents; Technical reports"
+)
+
+COURSE_DEPTHS = ('core', 'essential', 'advanced', 'intermediate')
+COURSE_LEVELS = ("Foundation", "Undergraduate", "Graduate", "Doctoral")
+COURSE_CREDITS = (5, 10, 15, 20, 30)
+SCHEDULE_DAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri')
+SCHEDULE_MINUTES = ('00', '20', '30', '40')
+
+DEGREE_TYPES = ("Bachelor of", "Master of", "PhD in", "Researcher in")
+COURSE_REQUIREMENTS = ('Core courses', 'Core courses plus electives')
+ENROLLMENT_PERIODS = ('Fall', 'Spring', 'Fall/Spring', 'Winter')
+SEMESTERS = ("Fall", "Spring", "Winter")
+
+# Enrollment status mix: 35% active, 50% completed, 10% failed, 5% withdrawn
+ENROLLMENT_STATUSES = ('active', 'completed', 'failed', 'withdrawn')
+ENROLLMENT_STATUS_CUM_WEIGHTS = (0.35, 0.85, 0.95, 1.0)
+
+FUNDING_SOURCES = (
+    "European Universities Initiative (EUI)", "ERC Synergy Grants", "Alumni Fund",
+    "University Grant", "Industry Partnership", "National Science Foundation (NSF)",
+    "UK Research and Innovation (UKRI)", "Horizon Europe", "Gates Foundation"
+)
+
+
 def maybe_null(nullable_chance: float = 0.7) -> bool:
     """Determine if a nullable field should be filled based on probability.
     
@@ -86,7 +188,7 @@ def maybe_null(nullable_chance: float = 0.7) -> bool:
     Returns:
         bool: True if field should be filled, False if it should be null
     """
-    return random.random() < nullable_chance
+    return _RNG.random() < nullable_chance
 
 
 def load_people_data() -> pd.DataFrame:
@@ -99,6 +201,9 @@ def load_people_data() -> pd.DataFrame:
     4. Verifies email format
     5. Ensures minimum record count
 
+    The validated records are cached next to the workbook and reused while
+    the cache is newer than the workbook.
+
     Returns:
         pd.DataFrame: DataFrame containing validated people records
 
@@ -108,16 +213,40 @@ def load_people_data() -> pd.DataFrame:
         pd.errors.EmptyDataError: If Excel file is empty
         Exception: For other Excel loading errors
     """
-    required_columns = ['First Name', 'Last Name', 'Email']
+    required_columns = PEOPLE_COLUMNS
     excel_path = os.path.join('data', '20250516220523_7885.xlsx')
+    # Validated records from an earlier run, reused until the workbook changes
+    cache_path = excel_path + '.pkl'
 
     try:
         # Check if file exists
         if not os.path.exists(excel_path):
             raise FileNotFoundError(f"Excel file not found at {excel_path}")
 
-        # Load Excel file
-        df = pd.read_excel(excel_path)
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(excel_path):
+            try:
+                df = pd.read_pickle(cache_path)
+            except Exception:
+                pass  # unreadable or incompatible cache (e.g. another pandas version), re-parse below
+            else:
+                # A cache written for a different column set is stale even if it is newer
+                if isinstance(df, pd.DataFrame) and list(df.columns) == required_columns:
+                    print(f"✅ Loaded {len(df)} valid records from cache")
+                    return df
+
+        # Load only the needed columns as strings, with the Rust calamine reader when it is installed
+        try:
+            import python_calamine  # noqa: F401
+            engine = 'calamine'
+        except ImportError:
+            engine = 'openpyxl'
+
+        df = pd.read_excel(
+            excel_path,
+            engine=engine,
+            usecols=lambda col: col in required_columns,
+            dtype={col: 'string' for col in required_columns}
+        )
 
         # Check if file is empty
         if df.empty:
@@ -128,19 +257,26 @@ def load_people_data() -> pd.DataFrame:
         if missing_cols:
             raise ValueError(f"Missing required columns: {', '.join(missing_cols)}")
 
-        # Remove rows with missing required values
-        df = df.dropna(subset=required_columns)
+        # Remove rows with missing required values; columns in PEOPLE_COLUMNS order,
+        # which is what a cached frame is checked against
+        df = df[required_columns].dropna()
 
         # Validate data
         if len(df) < 100:  # Minimum required records
             raise ValueError(f"Insufficient records in Excel file. Found {len(df)}, need at least 100")
 
-        # Basic email format validation
-        invalid_emails = df[~df['Email'].str.contains('@', na=False)]
-        if not invalid_emails.empty:
-            print(f"⚠️ Warning: Found {len(invalid_emails)} invalid email addresses")
+        # Basic email format validation (plain substring test, no regex)
+        valid_emails = df['Email'].str.contains('@', na=False, regex=False)
+        invalid_count = int((~valid_emails).sum())
+        if invalid_count:
+            print(f"⚠️ Warning: Found {invalid_count} invalid email addresses")
             # Remove invalid email rows
-            df = df[df['Email'].str.contains('@', na=False)]
+            df = df.loc[valid_emails]
+
+        try:
+            df.to_pickle(cache_path)
+        except OSError:
+            pass  # caching is best effort, e.g. on a read-only checkout
 
         print(f"✅ Loaded {len(df)} valid records from Excel file")
         return df
@@ -156,8 +292,9 @@ def load_people_data() -> pd.DataFrame:
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=None)
 def get_department_subjects(dept_name: str) -> List[str]:
-    """Get list of subjects taught in a department.
+    """Get list of subjects taught in a department (memoized; do not mutate the result).
 
     Args:
         dept_name: Name of the department
@@ -168,11 +305,61 @@ def get_department_subjects(dept_name: str) -> List[str]:
     return department_subjects.get(dept_name, [])
 
 
+def schema_is_fresh() -> bool:
+    """Check whether every model table already exists and holds no rows.
+
+    A fresh schema (e.g. the one the running app just created) can be seeded
+    as-is, without a drop/create DDL round-trip.
+
+    Returns:
+        bool: True if all tables exist and are empty, False otherwise
+    """
+    existing_tables = set(inspect(db.engine).get_table_names())
+    tables = db.metadata.sorted_tables
+    if any(table.name not in existing_tables for table in tables):
+        return False
+
+    return not any(
+        db.session.execute(select(literal(1)).select_from(table).limit(1)).first()
+        for table in tables
+    )
+
+
+def bulk_insert_rows(model, rows: List[Dict[str, Any]]) -> None:
+    """Bulk insert plain row dicts and write the new primary keys back into them.
+
+    NULLs are rendered explicitly so every row shares one column set and the
+    whole list goes out as a single executemany batch; by default the ORM
+    starts a new batch whenever the set of None-valued keys changes.
+
+    The new keys are the ones above the table's pre-insert maximum, selected
+    in order, so rows appended to a non-empty table are wired up correctly.
+    INSERT..RETURNING is not used: MySQL lacks it, and on SQLite returning the
+    keys in parameter order falls back to one statement per row.
+
+    Args:
+        model: Mapped model class of the target table
+        rows: Column-name to value mappings, one per row
+    """
+    if not rows:
+        return
+
+    pk = inspect(model).primary_key[0]
+    previous_max = db.session.scalar(select(func.coalesce(func.max(pk), 0)))
+    db.session.bulk_insert_mappings(model, rows, render_nulls=True)
+    keys = db.session.scalars(select(pk).where(pk > previous_max).order_by(pk)).all()
+
+    if len(keys) != len(rows):
+        raise RuntimeError(f"Expected {len(rows)} new {model.__tablename__} keys, found {len(keys)}")
+    for row, key in zip(rows, keys):
+        row[pk.key] = key
+
+
 def create_test_data() -> None:
     """Create and populate database with test data.
 
     This function orchestrates the creation of test data in the following order:
-    1. Clears existing database tables
+    1. Clears existing database tables (skipped when the schema is fresh)
     2. Loads and validates external data sources
     3. Creates departments and faculty structure
     4. Generates lecturers with appropriate qualifications
@@ -189,11 +376,17 @@ def create_test_data() -> None:
         ValueError: If insufficient records in source data
         Exception: For other database or data creation errors
     """
-    with app.app_context():
+    # No autoflush: the bulk statements run immediately, and the key lookups in between
+    # must not trigger a unit-of-work flush
+    with app.app_context(), relaxed_sqlite_durability(), db.session.no_autoflush:
         try:
-            # Clear existing database
-            db.drop_all()
-            db.create_all()
+            # Clear existing database, unless there is nothing to clear
+            if not schema_is_fresh():
+                db.drop_all()
+                db.create_all()
+
+            # NumPy generator for the per-row values drawn in batches
+            rng = np.random.default_rng(_SEED)
 
             # Load and validate source data with minimum requirements
             min_required = {
@@ -212,10 +405,15 @@ def create_test_data() -> None:
                     f"Need at least {total_required}, found {len(people_df)}"
                 )
 
+            # Build every full name and email in one column-wise pass, then split by role
+            full_names = (people_df['First Name'] + " " + people_df['Last Name']).tolist()
+            emails = people_df['Email'].tolist()
+            people = list(zip(full_names, emails))
+
             # Split data ensuring minimum requirements
-            student_data = people_df.iloc[:800]
-            lecturer_data = people_df.iloc[800:925]
-            staff_data = people_df.iloc[925:]
+            student_data = people[:800]
+            lecturer_data = people[800:925]
+            staff_data = people[925:]
 
             if len(student_data) < min_required['students']:
                 raise ValueError(f"Insufficient student records. Need {min_required['students']}")
@@ -228,193 +426,158 @@ def create_test_data() -> None:
             # Create Departments
             # ======================
             departments = []
-            faculty_dept_map = {}
 
             for faculty, dept_list in FACULTY_DEPARTMENTS.items():
                 # Select 3-5 departments per faculty
-                selected_depts = random.sample(
+                selected_depts = _RNG.sample(
                     dept_list,
-                    min(random.randint(3, 5), len(dept_list))
+                    min(_RNG.randint(3, 5), len(dept_list))
                 )
 
-                faculty_depts = []
                 for dept_name in selected_depts:
                     # Create department
                     research_areas = None
                     if maybe_null():
                         research_areas = ", ".join([
-                            random.choice([
-                                "Artificial Intelligence", "Machine Learning",
-                                "Ethics", "Education", "Interdisciplinary Studies",
-                                "Policy", "Human-Computer Interaction",
-                                "Psychology", "Philosophy", "Digital Transformation",
-                                "Quantitative Methods", "Qualitative Research",
-                                "Applied Research", "Sustainable Development"
-                            ]) for _ in range(random.randint(1, 3))
+                            _RNG.choice(RESEARCH_AREAS) for _ in range(_RNG.randint(1, 3))
                         ])
 
-                    dept = Department(
-                        name=dept_name,
-                        faculty=faculty,
-                        research_areas=research_areas
-                    )
-                    departments.append(dept)
-                    faculty_depts.append(dept)
-                    db.session.add(dept)
+                    departments.append({
+                        'name': dept_name,
+                        'faculty': faculty,
+                        'research_areas': research_areas
+                    })
 
-                faculty_dept_map[faculty] = faculty_depts
+            bulk_insert_rows(Department, departments)
 
             # ======================
             # Create Lecturers
             # ======================
             lecturers = []
-            qualifications = [
-                "PhD", "x2 PhD", "MPhil", "MRes",
-                "Masters", "x2 Masters", "DPhil"
-            ]
 
-            def create_lecturer(row, department):
-                """Helper function to create a lecturer with given data."""
+            def create_lecturer(name, email, department):
+                """Helper function to build a lecturer row for the given department."""
                 research_interests = None
                 if maybe_null():
-                    interests = [
-                        "Artificial Intelligence", "Machine Learning",
-                        "Ethics", "Education", "Interdisciplinary Studies",
-                        "Policy", "Human-Computer Interaction",
-                        "Psychology", "Philosophy", "Digital Transformation",
-                        "Quantitative Methods", "Qualitative Research",
-                        "Applied Research", "Sustainable Development"
-                    ]
-                    research_interests = "; ".join(random.sample(interests, random.randint(1, 3)))
+                    research_interests = "; ".join(_RNG.sample(RESEARCH_AREAS, _RNG.randint(1, 3)))
                 
                 # Contract details (nullable)
                 contract_details = None
                 if maybe_null():
-                    contract_details = random.choice([
-                        "Tenure-track", "Tenured", "Visiting Professor",
-                        "Fixed-term contract", "Research fellowship"
-                    ])
-
-                return Lecturer(
-                    name=f"{row['First Name']} {row['Last Name']}",
-                    email=row['Email'],
-                    department=department,
-                    academic_qualifications=random.choice(qualifications),
-                    employment_type=random.choice(["Full-Time", "Part-Time", "Contract"]),
-                    contract_details=contract_details,
-                    areas_of_expertise=None if not maybe_null() else random.choice(
-                        get_department_subjects(department.name)),
-                    research_interests=research_interests,
-                    publications=None if not maybe_null() else random.choice([
-                        "Journal publications; Conference papers",
-                        "Journal publications", "Books; Book chapters",
-                        "Patents; Technical reports"
-                    ]),
-                )
+                    contract_details = _RNG.choice(CONTRACT_TYPES)
+
+                return {
+                    'name': name,
+                    'email': email,
+                    'department_id': department['department_id'],
+                    'academic_qualifications': _RNG.choice(QUALIFICATIONS),
+                    'employment_type': _RNG.choice(EMPLOYMENT_TYPES),
+                    'contract_details': contract_details,
+                    'areas_of_expertise': None if not maybe_null() else _RNG.choice(
+                        get_department_subjects(department['name'])),
+                    'research_interests': research_interests,
+                    'publications': None if not maybe_null() else _RNG.choice(LECTURER_PUBLICATIONS),
+                }
 
             def distribute_lecturers(lecturer_data, departments):
-                """Distribute lecturers across departments ensuring minimum requirements."""
-                attempts = 0
-                max_attempts = 100  # Prevent infinite loops
-
-                while attempts < max_attempts:
-                    department_counts = {dept: 0 for dept in departments}
-                    lecturers = []
-
-                    # Try to distribute lecturers
-                    for idx, row in lecturer_data.iterrows():
-                        # Prioritize departments with fewer lecturers
-                        understaffed_depts = [
-                            d for d in departments
-                            if department_counts[d] < 2
-                        ]
-
-                        if understaffed_depts:
-                            # Assign to understaffed department
-                            department = random.choice(understaffed_depts)
-                        else:
-                            # All departments have minimum staff, assign randomly
-                            department = random.choice(departments)
+                """Distribute lecturers across departments, at least two per department.
+
+                The first two lecturers per department are dealt round-robin over a
+                shuffled department order, the remainder go to random departments.
+                """
+                min_per_dept = 2
+                needed = min_per_dept * len(departments)
+                if len(lecturer_data) < needed:
+                    raise ValueError(
+                        f"Not enough lecturers to staff every department. "
+                        f"Need {needed}, found {len(lecturer_data)}"
+                    )
 
-                        lecturer = create_lecturer(row, department)
-                        lecturers.append(lecturer)
-                        department_counts[department] += 1
+                dealing_order = _RNG.sample(departments, len(departments))
+                lecturers = []
 
-                    # Check if distribution meets requirements
-                    if all(count >= 2 for count in department_counts.values()):
-                        return lecturers
+                for position, (name, email) in enumerate(lecturer_data):
+                    if position < needed:
+                        department = dealing_order[position % len(dealing_order)]
+                    else:
+                        department = _RNG.choice(departments)
 
-                    attempts += 1
+                    lecturers.append(create_lecturer(name, email, department))
 
-                raise ValueError("Failed to distribute lecturers after maximum attempts")
+                return lecturers
 
             # Use the new distribution function
             try:
                 lecturers = distribute_lecturers(lecturer_data, departments)
-                for lecturer in lecturers:
-                    db.session.add(lecturer)
+                bulk_insert_rows(Lecturer, lecturers)
             except ValueError as e:
                 print(f"❌ Error: {str(e)}")
                 sys.exit(1)
 
+            # Index lecturers by department once instead of rescanning them per course and student
+            lecturers_by_dept = defaultdict(list)
+            for lecturer in lecturers:
+                lecturers_by_dept[lecturer['department_id']].append(lecturer)
+
             # ======================
             # Create Courses
             # ======================
             courses = []
-            course_codes = set()
+            # Unused code numbers per prefix, pre-shuffled; prefixes repeat across departments
+            code_pools = {}
 
             # Generate courses for each department
             for dept in departments:
+                # Per-department values, computed once rather than per course
+                prefix = ''.join(w[0] for w in dept['name'].split() if w not in ("of", "and", "the")).upper()
+                dept_lecturers = lecturers_by_dept[dept['department_id']]
+                # Get subjects for this department from JSON mapping
+                dept_subjects = get_department_subjects(dept['name'])
+
+                # Draw 1-5 unique course codes for this department
+                if prefix not in code_pools:
+                    code_pools[prefix] = _RNG.sample(range(100, 500), 400)
+                code_pool = code_pools[prefix]
+                code_numbers = [code_pool.pop() for _ in range(min(_RNG.randint(1, 5), len(code_pool)))]
+
                 # Create 1-5 courses per department
-                for _ in range(random.randint(1, 5)):
-                    # Generate unique course code
-                    prefix = ''.join(w[0] for w in dept.name.split() if w not in ["of", "and", "the"]).upper()
-                    while True:
-                        code = f"{prefix}{random.randint(100, 499)}"
-                        if code not in course_codes:
-                            course_codes.add(code)
-                            break
+                for code_number in code_numbers:
+                    code = f"{prefix}{code_number}"
 
                     # Select 1-2 lecturers from same department
-                    dept_lecturers = [l for l in lecturers if l.department == dept]
                     if not dept_lecturers:
                         # Skip creating a course if no lecturers in the department are available
                         continue
 
-                    course_lecturers = random.sample(
+                    course_lecturers = _RNG.sample(
                         dept_lecturers,
-                        min(random.randint(1, 2), len(dept_lecturers))
+                        min(_RNG.randint(1, 2), len(dept_lecturers))
                     )
 
-                    course_names = [
-                        "Introduction to", "Advanced", "Principles of",
-                        "Topics in", "Seminar in", "Fundamentals of",
-                        "Theories of", "Research Methods in"
-                    ]
-
-                    # Get subjects for this department from JSON mapping
-                    dept_subjects = get_department_subjects(dept.name)
-
                     # If no subjects found, skip this course
                     if not dept_subjects:
                         continue
 
-                    subject = random.choice(dept_subjects)
-
-                    course = Course(
-                        code=code,
-                        name=f"{random.choice(course_names)} {subject}",
-                        description=f"This course covers {random.choice(['core', 'essential', 'advanced', 'intermediate'])} concepts in {subject}",
-                        level=random.choice(["Foundation", "Undergraduate", "Graduate", "Doctoral"]),
-                        credits=random.choice([5, 10, 15, 20, 30]),
-                        schedule=None if not maybe_null() else f"{random.choice(['Mon', 'Tue', 'Wed', 'Thu', 'Fri'])} "
-                                                               f"{random.randint(9, 17)}:"
-                                                               f"{random.choice(['00', '20', '30', '40'])}",
-                        department=dept
-                    )
-                    courses.append(course)
-                    db.session.add(course)
-            
+                    subject = _RNG.choice(dept_subjects)
+
+                    courses.append({
+                        'code': code,
+                        'name': f"{_RNG.choice(COURSE_NAME_PREFIXES)} {subject}",
+                        'description': f"This course covers {_RNG.choice(COURSE_DEPTHS)} concepts in {subject}",
+                        'level': _RNG.choice(COURSE_LEVELS),
+                        'credits': _RNG.choice(COURSE_CREDITS),
+                        'schedule': None if not maybe_null() else f"{_RNG.choice(SCHEDULE_DAYS)} "
+                                                                  f"{_RNG.randint(9, 17)}:"
+                                                                  f"{_RNG.choice(SCHEDULE_MINUTES)}",
+                        'department_id': dept['department_id']
+                    })
+
+            bulk_insert_rows(Course, courses)
+
+            courses_by_dept = defaultdict(list)
+            for course in courses:
+                courses_by_dept[course['department_id']].append(course)
+
             # ======================
             # Create Programs
             # ======================
@@ -423,264 +586,232 @@ def create_test_data() -> None:
             # Create programs for each department
             for dept in departments:
                 # Create 1-3 programs per department
-                for _ in range(random.randint(1, 3)):
-                    degree_types = ["Bachelor of", "Master of", "PhD in", 'Researcher in']
-                    degree_name = FACULTY_DEGREE_MAPPING.get(dept.faculty, ["General Studies"])
-                    dept_name = dept.name.replace("Department of ", "")
+                for _ in range(_RNG.randint(1, 3)):
+                    degree_name = FACULTY_DEGREE_MAPPING.get(dept['faculty'], ["General Studies"])
+                    dept_name = dept['name'].replace("Department of ", "")
 
-                    degree_type = random.choice(degree_types)
+                    degree_type = _RNG.choice(DEGREE_TYPES)
 
                     # Set duration based on degree type
                     if degree_type == "Bachelor of":
-                        duration = random.randint(3, 4)
+                        duration = _RNG.randint(3, 4)
                     elif degree_type == "Master of":
-                        duration = random.randint(1, 2)
+                        duration = _RNG.randint(1, 2)
                     elif degree_type == "PhD in":
-                        duration = random.randint(3, 5)
+                        duration = _RNG.randint(3, 5)
                     else:  # Researcher in
-                        duration = random.randint(1, 3)
-
-                    program = Program(
-                        name=f"{degree_type} {dept_name}",
-                        degree_awarded=f"{degree_type} {random.choice(degree_name)}",
-                        duration=duration,
-                        department=dept,
-                        course_requirements=None if not maybe_null()
-                        else f"{random.choice(['Core courses', 'Core courses plus electives'])}",
-                        enrollment_details=None if not maybe_null()
-                        else f"Open enrollment in {random.choice(['Fall', 'Spring', 'Fall/Spring', 'Winter'])}"
-                    )
-                    programs.append(program)
-                    db.session.add(program)
+                        duration = _RNG.randint(1, 3)
+
+                    programs.append({
+                        'name': f"{degree_type} {dept_name}",
+                        'degree_awarded': f"{degree_type} {_RNG.choice(degree_name)}",
+                        'duration': duration,
+                        'department_id': dept['department_id'],
+                        'course_requirements': None if not maybe_null()
+                        else _RNG.choice(COURSE_REQUIREMENTS),
+                        'enrollment_details': None if not maybe_null()
+                        else f"Open enrollment in {_RNG.choice(ENROLLMENT_PERIODS)}"
+                    })
+
+            bulk_insert_rows(Program, programs)
 
             # ======================
             # Create Students
             # ======================
             students = []
-
-            for idx, row in student_data.iterrows():
+            # Offerings keyed by (course_id, lecturer_id, semester, year), created on first use
+            offerings = {}
+            # (student row, offering row, enrollment row); FKs are filled in once keys exist
+            pending_enrollments = []
+
+            # Offerings run this year or last; enrollments fall between 1 year and 30 days ago
+            today = date.today()
+            offering_years = (today.year, today.year - 1)
+            enrollment_start = today - timedelta(days=365)
+            enrollment_span_days = ((today - timedelta(days=30)) - enrollment_start).days
+
+            # Draw the per-student random values in batches instead of several calls per student
+            n_students = len(student_data)
+            program_picks = rng.integers(0, len(programs), size=n_students).tolist()
+            skip_courses = (rng.random(n_students) < 0.12).tolist()
+            course_counts = rng.integers(1, 6, size=n_students).tolist()
+            # Birth dates 18-50 years back, as day offsets from today (tolist() yields datetime.date)
+            birth_offsets = rng.integers(18 * 365, 51 * 365, size=n_students).astype('timedelta64[D]')
+            birth_dates = (np.datetime64(today, 'D') - birth_offsets).tolist()
+            years_of_study = rng.integers(1, 5, size=n_students).tolist()
+
+            for i, (name, email) in enumerate(student_data):
                 # Select a random program
-                program = random.choice(programs)
+                program = programs[program_picks[i]]
 
                 # Select advisor from same department as program
-                dept_lecturers = [l for l in lecturers if l.department == program.department]
-                advisor = random.choice(dept_lecturers) if dept_lecturers else random.choice(lecturers)
+                dept_lecturers = lecturers_by_dept[program['department_id']]
+                advisor = _RNG.choice(dept_lecturers) if dept_lecturers else _RNG.choice(lecturers)
 
                 # Select 1-5 courses from same department
-                dept_courses = [c for c in courses if c.department == program.department]
+                dept_courses = courses_by_dept[program['department_id']]
 
                 # Handle course assignment
-                if not dept_courses or random.random() < 0.12:
+                if not dept_courses or skip_courses[i]:
                     student_courses = []  # Always use empty list instead of None
                 else:
-                    student_courses = random.sample(
+                    student_courses = _RNG.sample(
                         dept_courses,
-                        min(random.randint(1, 5), len(dept_courses))
+                        min(course_counts[i], len(dept_courses))
                     )
 
-                # Generate birth date (18-50 years old)
-                today = date.today()
-                age = random.randint(18, 50)
-                birth_year = today.year - age
-                birth_month = random.randint(1, 12)
-                birth_day = random.randint(1, 28)
-                birth_date = date(birth_year, birth_month, birth_day)
-
-                student = Student(
-                name=f"{row['First Name']} {row['Last Name']}",
-                email=row['Email'],
-                date_of_birth=birth_date,
-                year_of_study=random.randint(1, 4),
-                current_grades=round(random.uniform(35.0, 85.0), 1),
-                graduation_status=None if not maybe_null() else random.choice([True, False]),
-                disciplinary_record=None if not maybe_null() else random.choice([True, False]),
-                program=program,
-                advisor=advisor
-                )
+                student = {
+                    'name': name,
+                    'email': email,
+                    'date_of_birth': birth_dates[i],
+                    'year_of_study': years_of_study[i],
+                    # Unfilled flags store the column default (False) rather than NULL
+                    'graduation_status': False if not maybe_null() else _RNG.choice([True, False]),
+                    'disciplinary_record': False if not maybe_null() else _RNG.choice([True, False]),
+                    'enrolled_program_id': program['program_id'],
+                    'advisor_id': advisor['lecturer_id']
+                }
                 students.append(student)
-                db.session.add(student)
+
+                # Weighted grade totals for the student's graded (completed or failed) courses
+                total_weighted_grade = 0
+                total_credits = 0
 
                 for course in student_courses:
                     # Get lecturers who are supposed to teach this course
-                    course_lecturers = [lecturer for lecturer in lecturers if lecturer.department == course.department]
+                    course_lecturers = lecturers_by_dept[course['department_id']]
 
                     if course_lecturers:
-                        lecturer = random.choice(course_lecturers)
+                        lecturer = _RNG.choice(course_lecturers)
 
                         # Generate semester and year
-                        current_year = date.today().year
-                        semester_options = ["Fall", "Spring", "Winter"]
-                        semester = random.choice(semester_options)
-                        year = random.choice([current_year, current_year-1])
+                        semester = _RNG.choice(SEMESTERS)
+                        year = _RNG.choice(offering_years)
 
                         # Create or get CourseOffering
-                        offering = CourseOffering.query.filter_by(
-                            course_id=course.course_id,
-                            lecturer_id=lecturer.lecturer_id,
-                            semester=semester,
-                            year=year
-                        ).first()
-
-                        if not offering:
-                            offering = CourseOffering(
-                                course_id=course.course_id,
-                                lecturer_id=lecturer.lecturer_id,
-                                semester=semester,
-                                year=year
-                            )
-                            db.session.add(offering)
-                            db.session.flush()  # Get offering_id
+                        offering_key = (course['course_id'], lecturer['lecturer_id'], semester, year)
+                        offering = offerings.get(offering_key)
+
+                        if offering is None:
+                            offering = offerings[offering_key] = {
+                                'course_id': course['course_id'],
+                                'lecturer_id': lecturer['lecturer_id'],
+                                'semester': semester,
+                                'year': year
+                            }
 
                         # Determine enrollment status and grade
-                        status_weights = {
-                            'active': 0.35,      # 35% active
-                            'completed': 0.50,  # 50% completed
-                            'failed': 0.10,      # 10% failed
-                            'withdrawn': 0.05   # 5% withdrawn
-                        }
-                        status = random.choices(
-                            list(status_weights.keys()), 
-                            weights=list(status_weights.values())
-                        )[0]
+                        status = _RNG.choices(ENROLLMENT_STATUSES, cum_weights=ENROLLMENT_STATUS_CUM_WEIGHTS)[0]
 
                         # Generate grade based on status
                         grade = None
                         if status == 'completed':
-                            grade = random.uniform(50, 85)  # Passing grades
+                            grade = _RNG.uniform(50, 85)  # Passing grades
                         elif status == 'failed':
-                            grade = random.uniform(35, 49)    # Failing grades
+                            grade = _RNG.uniform(35, 49)    # Failing grades
 
                         # Generate random enrollment date within realistic range
-                        start_date = date.today() - timedelta(days=365)  # 1 year ago
-                        end_date = date.today() - timedelta(days=30)     # 30 days ago
-                        random_days = random.randint(0, (end_date - start_date).days)
-                        enrollment_date = start_date + timedelta(days=random_days)
-
-                        # Create Enrollment with correct fields
-                        enrollment = Enrollment(
-                            student_id=student.student_id,
-                            offering_id=offering.offering_id,
-                            grade=round(grade, 2) if grade is not None else None,
-                            status=status,
-                            enrollment_date=enrollment_date
-                        )
-                        db.session.add(enrollment)
-
-            # Update course load for lecturers after all enrollments are created
-            for lecturer in lecturers:
-                lecturer.update_course_load()
-
-            # =================================
-            # Calculate Student Current Grades
-            # =================================
-            
-            # Calculate weighted average grades for each student
-            for student in students:
-                # Get all enrollments with grades (completed or failed courses)
-                graded_enrollments = [
-                    enrollment for enrollment in student.enrollments 
-                    if enrollment.grade is not None
-                ]
-                
-                if graded_enrollments:
-                    # Calculate weighted average based on course credits
-                    total_weighted_grade = 0
-                    total_credits = 0
-                    
-                    for enrollment in graded_enrollments:
-                        course_credits = enrollment.offering.course.credits
-                        total_weighted_grade += enrollment.grade * course_credits
-                        total_credits += course_credits
-                    
-                    if total_credits > 0:
-                        student.current_grades = round(total_weighted_grade / total_credits, 1)
-                    else:
-                        student.current_grades = 0.0
+                        enrollment_date = enrollment_start + timedelta(days=_RNG.randint(0, enrollment_span_days))
+
+                        enrollment = {
+                            'grade': round(grade, 2) if grade is not None else None,
+                            'status': status,
+                            'enrollment_date': enrollment_date
+                        }
+                        pending_enrollments.append((student, offering, enrollment))
+
+                        if enrollment['grade'] is not None:
+                            total_weighted_grade += enrollment['grade'] * course['credits']
+                            total_credits += course['credits']
+
+                # Weighted average grade over course credits; 0.0 with no graded courses yet
+                if total_credits > 0:
+                    student['current_grades'] = round(total_weighted_grade / total_credits, 1)
                 else:
-                    student.current_grades = 0.0  # No graded courses yet
-            
+                    student['current_grades'] = 0.0
+
+            bulk_insert_rows(Student, students)
+
+            offering_rows = list(offerings.values())
+            bulk_insert_rows(CourseOffering, offering_rows)
+
+            enrollments = []
+            for student, offering, enrollment in pending_enrollments:
+                enrollment['student_id'] = student['student_id']
+                enrollment['offering_id'] = offering['offering_id']
+                enrollments.append(enrollment)
+            db.session.bulk_insert_mappings(Enrollment, enrollments, render_nulls=True)
+
+            # Update course load for lecturers after all offerings are created, counted in one UPDATE
+            db.session.execute(
+                update(Lecturer).values(
+                    course_load=select(func.count(CourseOffering.offering_id))
+                    .where(CourseOffering.lecturer_id == Lecturer.lecturer_id)
+                    .scalar_subquery()
+                ),
+                execution_options={'synchronize_session': False}
+            )
+
             # ======================
             # Create Staff
             # ======================
             staff = []
 
-            job_titles = [
-                "Administrator", "Secretary", "Lab Technician",
-                "IT Support", "Librarian", "Maintenance",
-                "Security Officer", "Careers Advisor"
-            ]
-
-            for idx, row in staff_data.iterrows():
+            for name, _ in staff_data:
                 # Select random department
-                department = random.choice(departments)
+                department = _RNG.choice(departments)
 
-                staff_member = NonAcademicStaff(
-                    name=f"{row['First Name']} {row['Last Name']}",
-                    job_title=random.choice(job_titles),
-                    employment_type=random.choice(["Full-Time", "Part-Time", "Contract"]),
-                    department=department
-                )
-                staff.append(staff_member)
-                db.session.add(staff_member)
+                staff.append({
+                    'name': name,
+                    'job_title': _RNG.choice(JOB_TITLES),
+                    'employment_type': _RNG.choice(EMPLOYMENT_TYPES),
+                    'department_id': department['department_id']
+                })
+
+            db.session.bulk_insert_mappings(NonAcademicStaff, staff, render_nulls=True)
 
             # ======================
             # Create Research Projects
             # ======================
             projects = []
+            project_teams = []
 
-            # Create 30-50 research projects
-            for _ in range(random.randint(30, 50)):
+            # Create 30-50 research projects; PIs and team sizes (1-7 lecturers) are drawn up front
+            n_projects = _RNG.randint(30, 50)
+            pi_picks = rng.integers(0, len(lecturers), size=n_projects).tolist()
+            team_sizes = np.minimum(rng.integers(1, 8, size=n_projects), len(lecturers)).tolist()
+
+            for pi_idx, team_size in zip(pi_picks, team_sizes):
                 # Select principal investigator
-                pi = random.choice(lecturers)
+                pi = lecturers[pi_idx]
 
-                # Select team members (1-7 lecturers)
-                team_size = random.randint(1, 7)
-                team = random.sample(lecturers, min(team_size, len(lecturers)))
+                # Select team members as lecturer indices, without replacement
+                team = rng.choice(len(lecturers), size=team_size, replace=False).tolist()
 
                 # Ensure PI is in team
-                if pi not in team:
-                    team.append(pi)
+                if pi_idx not in team:
+                    team.append(pi_idx)
 
                 # Generate outcomes (nullable)
                 outcomes = None
                 if maybe_null():
-                    possible_outcomes = [
-                        "New international framework", "3 publications",
-                        "Patent application", "Improved algorithm",
-                        "United Nations advisory", "Educational software",
-                        "Conference presentation", "Industry partnership"
-                    ]
-                    outcomes = ";".join(random.sample(possible_outcomes, random.randint(1, 3)))
-
-                project_titles = [
-                    "Advanced Research in", "Study of", "Investigation into",
-                    "Development of", "Analysis of", "Applications of", "Review of",
-                    "Exploration of", "Impact of", "Trends in", "Future of"
-                ]
-
-                subjects = [
-                    "Machine Learning", "Artificial Intelligence", "Interdisciplinary Studies",
-                    "Global Digital Infrastructure", "World Sustainability", "Marcusian Studies",
-                    "Global Security", "Climate Change", "Academic Evolution", "European Union",
-                    "[redacted] - CLASSIFIED RESEARCH", "Educational Technology", "Smart University Initiative (SUI)"
-                ]
-
-                project = ResearchProject(
-                    title=f"{random.choice(project_titles)} {random.choice(subjects)}",
-                    funding_sources=None if not maybe_null() else random.choice([
-                        "European Universities Initiative (EUI)", "ERC Synergy Grants", "Alumni Fund",
-                        "University Grant", "Industry Partnership", "National Science Foundation (NSF)",
-                        "UK Research and Innovation (UKRI)", "Horizon Europe", "Gates Foundation"
-                    ]),
-                    principal_investigator=pi,
-                    team_members=team,
-                    publications=None if not maybe_null() else random.choice(["Journal publications; Conference papers",
-                                                                              "Journal publications",
-                                                                              "Patents; Technical reports"]),
-                    outcomes=outcomes
-                )
-                projects.append(project)
-                db.session.add(project)
+                    outcomes = ";".join(_RNG.sample(PROJECT_OUTCOMES, _RNG.randint(1, 3)))
+
+                projects.append({
+                    'title': f"{_RNG.choice(PROJECT_TITLE_PREFIXES)} {_RNG.choice(PROJECT_SUBJECTS)}",
+                    'funding_sources': None if not maybe_null() else _RNG.choice(FUNDING_SOURCES),
+                    'principal_investigator_id': pi['lecturer_id'],
+                    'publications': None if not maybe_null() else _RNG.choice(PROJECT_PUBLICATIONS),
+                    'outcomes': outcomes
+                })
+                project_teams.append(team)
+
+            bulk_insert_rows(ResearchProject, projects)
+            db.session.execute(project_team_members.insert(), [
+                {'project_id': project['project_id'], 'lecturer_id': lecturers[member]['lecturer_id']}
+                for project, team in zip(projects, project_teams)
+                for member in team
+            ])
 
             # Commit all changes
             db.session.commit()
@@ -0,0 +1,62 @@
+"""University Records Management System one-shot setup pipeline.
+
+Ensures the database and tables exist, then runs the Flask-Migrate scaffolding
+(``flask db init`` and the initial ``flask db migrate``) followed by the
+expanded database seeder inside a single interpreter, so the Flask application
+and its extensions are loaded once rather than once per ``flask``/``python -m``
+subprocess.
+
+The stages can also be run on their own (``python -m scripts.setup_pipeline
+migrate`` or ``... seed``). The launcher runs the migrate stage before the
+Flask server starts, so the schema is never created by two processes at once,
+and only overlaps the seed stage with the server warmup. Any failing step
+exits with a non-zero status (Flask-Migrate commands exit with 1 on error, as
+they do from the CLI).
+"""
+
+import sys
+
+from flask_migrate import init, migrate
+
+from app.utils.database import init_db
+from run import app
+from scripts.seed_database_expanded import create_test_data
+
+
+def run_migrations() -> None:
+    """Create the database and tables, initialise migrations and create the initial migration."""
+    # Same idempotent bootstrap the server runs on startup; migrate needs the tables
+    init_db(app)
+
+    with app.app_context():
+        print("* Initializing Flask-Migrate...", flush=True)
+        init()
+
+        print("* Creating initial database migration...", flush=True)
+        migrate(message="Initial migration.")
+
+
+def run_seed() -> None:
+    """Seed the database with the expanded sample data."""
+    print("* Seeding the database with sample data (expanded)...", flush=True)
+    create_test_data()
+
+
+STAGES = {
+    'migrate': run_migrations,
+    'seed': run_seed,
+}
+
+
+def run_pipeline(stages=tuple(STAGES)) -> None:
+    """Run the named setup stages in order (all of them by default)."""
+    for stage in stages:
+        STAGES[stage]()
+
+
+if __name__ == "__main__":
+    requested = sys.argv[1:] or tuple(STAGES)
+    unknown = [stage for stage in requested if stage not in STAGES]
+    if unknown:
+        sys.exit(f"Unknown setup stage(s): {', '.join(unknown)} (choose from {', '.join(STAGES)})")
+    run_pipeline(requested)
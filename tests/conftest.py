@@ -0,0 +1,322 @@
+import contextlib
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+from flask_sqlalchemy.session import Session as FlaskSession
+from sqlalchemy.orm import Session
+
+from app import create_app
+from app.utils.database import db
+from app.models import (
+    Department, Lecturer, Course, Student, CourseOffering,
+    Program, Enrollment, NonAcademicStaff, ResearchProject
+)
+
+
+_APP_KEY = pytest.StashKey()
+
+
+def pytest_configure(config):
+    """Build the testing app and serve one request before any test runs.
+
+    The instance is stashed on the config and handed out by the ``app`` fixture, so
+    its URL map, Flask-RESTx setup and engine are already initialised and that
+    one-off cost is not charged to whichever test happens to run first.
+    """
+    app = config.stash[_APP_KEY] = create_app('testing')
+    with app.app_context():
+        db.engine.connect().close()
+    app.test_client().get('/api/health')
+
+
+class SavepointSession(FlaskSession):
+    """Session pinned to the test connection.
+
+    Flask-SQLAlchemy routes every statement to the engine, which would bypass the
+    per-test transaction the session is bound to.
+    """
+
+    def get_bind(self, *args, **kwargs):
+        return self.bind
+
+
+@contextlib.contextmanager
+def outer_transaction(engine):
+    """Yield a connection inside a transaction that is rolled back on exit.
+
+    Nothing done on the connection is ever committed to the database.
+    """
+    connection = engine.connect()
+    # pysqlite would open the transaction lazily, making the first SAVEPOINT the outermost
+    # transaction (its RELEASE would really commit); take over and BEGIN explicitly
+    dbapi_connection = connection.connection.dbapi_connection
+    isolation_level = dbapi_connection.isolation_level
+    dbapi_connection.isolation_level = None
+    transaction = connection.begin()
+    connection.exec_driver_sql("BEGIN")
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        dbapi_connection.isolation_level = isolation_level
+        connection.close()
+
+
+@contextlib.contextmanager
+def savepoint_session(_db, connection):
+    """Swap the app's scoped session for one joined to ``connection`` through a SAVEPOINT.
+
+    Commits inside the block only release the SAVEPOINT, and whatever is left is
+    rolled back when the session is removed on exit.
+    """
+    _db.session.remove()
+
+    app_session = _db.session
+    _db.session = _db._make_scoped_session({
+        'class_': SavepointSession,
+        'bind': connection,
+        'join_transaction_mode': 'create_savepoint'
+    })
+    try:
+        yield _db.session
+    finally:
+        _db.session.remove()
+        _db.session = app_session
+
+
+@contextlib.contextmanager
+def count_queries(conn):
+    """Collect the SQL statements executed on ``conn`` while the block runs."""
+    queries = []
+
+    def hook(conn, cursor, statement, *args, **kwargs):
+        queries.append(statement)
+
+    event.listen(conn, "before_cursor_execute", hook)
+    try:
+        yield queries
+    finally:
+        event.remove(conn, "before_cursor_execute", hook)
+
+
+@contextlib.contextmanager
+def record_lazy_loads():
+    """Collect the relationship lazy loads issued by any session while the block runs.
+
+    Eager (selectin/joined) loads are not recorded, so an empty list means the code
+    under test was served entirely from the eager-load graph of its queries.
+    """
+    lazy_loads = []
+
+    def hook(orm_execute_state):
+        if orm_execute_state.lazy_loaded_from is not None:
+            lazy_loads.append(str(orm_execute_state.statement))
+
+    event.listen(Session, "do_orm_execute", hook)
+    try:
+        yield lazy_loads
+    finally:
+        event.remove(Session, "do_orm_execute", hook)
+
+
+# ===============================
+# Shared Fixtures
+# ===============================
+
+@pytest.fixture(scope="session")
+def app(pytestconfig):
+    """The test Flask app instance built in pytest_configure."""
+    return pytestconfig.stash[_APP_KEY]
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a test client shared by every test module.
+
+    No test relies on cookies or session state. The client is not entered as a
+    context manager, which would keep each request's context pushed into the next test.
+    """
+    return app.test_client()
+
+@pytest.fixture(scope="session")
+def _db(app):
+    """Create the test database schema once for the whole run.
+
+    Under pytest-xdist each worker is its own process with its own in-memory
+    database, so workers never share state.
+    """
+    with app.app_context():
+        db.create_all()
+        yield db
+        # An in-memory database disappears with the process, schema and all
+        if not app.config['SQLALCHEMY_DATABASE_URI'].endswith(':memory:'):
+            db.drop_all()
+
+@pytest.fixture(scope="module")
+def connection(_db):
+    """Open the connection whose outer transaction holds this module's seed data.
+
+    The transaction is rolled back once the module's tests have run, so nothing is
+    ever committed to the database.
+    """
+    with outer_transaction(_db.engine) as connection:
+        yield connection
+
+@pytest.fixture(scope="module")
+def seed_data(_db, connection):
+    """Build the baseline object graph once and flush it in a single batch."""
+    # The session works directly in the module's outer transaction and never commits
+    # or closes it, so the flushed rows stay there until the module ends
+    session = SavepointSession(_db, bind=connection, join_transaction_mode='rollback_only')
+
+    department = Department(
+        name="Computer Science",
+        faculty="Engineering",
+        research_areas="Artificial Intelligence;Cybersecurity"
+    )
+    lecturer = Lecturer(
+        name="Dr. Alice Smith",
+        email="a.smith@uni.ac.uk",
+        academic_qualifications="PhD in Computer Science",
+        employment_type="Full-Time",
+        department=department,
+        research_interests="Machine Learning;Neural Networks",
+        areas_of_expertise="AI;Machine Learning;Deep Learning",
+        course_load=2
+    )
+    course = Course(
+        code="CS101",
+        name="Introduction to Programming",
+        description="Fundamentals of programming using Python",
+        level="Undergraduate",
+        credits=15,
+        department=department,
+        schedule="Mon 10:00-12:00, Wed 14:00-16:00"
+    )
+    offering = CourseOffering(
+        course=course,
+        lecturer=lecturer,
+        semester="Fall",
+        year=2024
+    )
+    program = Program(
+        name="Computer Science BSc",
+        degree_awarded="Bachelor of Science",
+        duration=3,
+        department=department,
+        course_requirements="120 credits minimum",
+        enrollment_details="September intake"
+    )
+    student = Student(
+        name="John Doe",
+        email="john.doe@student.uni.ac.uk",
+        date_of_birth=date(2000, 1, 15),
+        year_of_study=2,
+        current_grades=75.5,
+        program=program,
+        advisor=lecturer,
+        graduation_status=False,
+        disciplinary_record=False
+    )
+    enrollment = Enrollment(
+        student=student,
+        offering=offering,
+        enrollment_date=date(2024, 9, 1),
+        grade=85.0,
+        status="completed"
+    )
+    staff = NonAcademicStaff(
+        name="Sarah Wilson",
+        job_title="Department Administrator",
+        employment_type="Full-Time",
+        department=department
+    )
+    project = ResearchProject(
+        title="Advanced Machine Learning Techniques",
+        funding_sources="UK Research Council;EPSRC",
+        principal_investigator=lecturer,
+        outcomes="New ML framework;3 publications;Patent application",
+        publications="Smith, A. et al. (2024). Novel ML Approaches. Nature AI."
+    )
+    project.team_members = [lecturer]
+
+    # Every other object hangs off the department through its relationships, so the
+    # save-update cascade brings the whole graph into the session
+    session.add(department)
+    session.flush()
+    session.close()
+
+    return SimpleNamespace(
+        department=department,
+        lecturer=lecturer,
+        course=course,
+        offering=offering,
+        program=program,
+        student=student,
+        enrollment=enrollment,
+        staff=staff,
+        research_project=project
+    )
+
+@pytest.fixture
+def db_session(_db, connection, seed_data):
+    """Bind the app's session to the module connection for one test.
+
+    The session joins through a SAVEPOINT, and commits only release it into an outer
+    SAVEPOINT that is always rolled back, so nothing a test does reaches the seed data.
+    The seed itself must be in place first, or it would be rolled back with the test.
+    """
+    transaction = connection.begin_nested()
+    with savepoint_session(_db, connection) as session:
+        yield session
+    transaction.rollback()
+
+def _seeded(seed_data, db_session, name):
+    # Seed objects are clean, so merging them copies their state without a SELECT
+    return db_session.merge(getattr(seed_data, name), load=False)
+
+@pytest.fixture
+def department(seed_data, db_session):
+    """The seeded test department."""
+    return _seeded(seed_data, db_session, 'department')
+
+@pytest.fixture
+def lecturer(seed_data, db_session):
+    """The seeded test lecturer."""
+    return _seeded(seed_data, db_session, 'lecturer')
+
+@pytest.fixture
+def course(seed_data, db_session):
+    """The seeded test course."""
+    return _seeded(seed_data, db_session, 'course')
+
+@pytest.fixture
+def course_offering(seed_data, db_session):
+    """The seeded test course offering."""
+    return _seeded(seed_data, db_session, 'offering')
+
+@pytest.fixture
+def program(seed_data, db_session):
+    """The seeded test program."""
+    return _seeded(seed_data, db_session, 'program')
+
+@pytest.fixture
+def student(seed_data, db_session):
+    """The seeded test student."""
+    return _seeded(seed_data, db_session, 'student')
+
+@pytest.fixture
+def enrollment(seed_data, db_session):
+    """The seeded test enrollment."""
+    return _seeded(seed_data, db_session, 'enrollment')
+
+@pytest.fixture
+def staff(seed_data, db_session):
+    """The seeded test non-academic staff member."""
+    return _seeded(seed_data, db_session, 'staff')
+
+@pytest.fixture
+def research_project(seed_data, db_session):
+    """The seeded test research project."""
+    return _seeded(seed_data, db_session, 'research_project')
@@ -1,186 +1,81 @@
 import pytest
 from datetime import date
-from app import create_app
-from app.utils.database import db
+from sqlalchemy import inspect as sa_inspect, select
+from sqlalchemy.exc import IntegrityError
 from app.models import (
     Department, Lecturer, Course, Student, CourseOffering,
     Program, Enrollment, NonAcademicStaff, ResearchProject
 )
 
 
+# Model tests commit and delete freely; db_session rolls all of it back
+pytestmark = pytest.mark.usefixtures("db_session")
+
+
 # ===============================
-# Test Fixtures
+# Test Model Creation
 # ===============================
 
-@pytest.fixture
-def app():
-    """Create and configure a test Flask app instance."""
-    app = create_app('testing')
-    return app
-
-@pytest.fixture
-def client(app):
-    """Create a test client for the app."""
-    return app.test_client()
-
-@pytest.fixture
-def _db(app):
-    """Create and initialize test database."""
-    with app.app_context():
-        db.create_all()
-        yield db
-        db.drop_all()
-
-@pytest.fixture
-def department(_db):
-    """Create a test department."""
-    dept = Department(
+@pytest.mark.parametrize("obj_fixture,expected", [
+    ("department", dict(
         name="Computer Science",
         faculty="Engineering",
         research_areas="Artificial Intelligence;Cybersecurity"
-    )
-    _db.session.add(dept)
-    _db.session.commit()
-    return dept
-
-@pytest.fixture
-def lecturer(department, _db):
-    """Create a test lecturer."""
-    lecturer = Lecturer(
+    )),
+    ("lecturer", dict(
         name="Dr. Alice Smith",
         email="a.smith@uni.ac.uk",
-        academic_qualifications="PhD in Computer Science",
         employment_type="Full-Time",
-        department=department,
-        research_interests="Machine Learning;Neural Networks",
-        areas_of_expertise="AI;Machine Learning;Deep Learning",
         course_load=2
-    )
-    _db.session.add(lecturer)
-    _db.session.commit()
-    return lecturer
-
-@pytest.fixture
-def course(department, _db):
-    """Create a test course."""
-    course = Course(
+    )),
+    ("course", dict(
         code="CS101",
         name="Introduction to Programming",
-        description="Fundamentals of programming using Python",
-        level="Undergraduate",
         credits=15,
-        department=department,
         schedule="Mon 10:00-12:00, Wed 14:00-16:00"
-    )
-    _db.session.add(course)
-    _db.session.commit()
-    return course
-
-@pytest.fixture
-def course_offering(course, lecturer, _db):
-    """Create a test course offering."""
-    offering = CourseOffering(
-        course=course,
-        lecturer=lecturer,
-        semester="Fall",
-        year=2024
-    )
-    _db.session.add(offering)
-    _db.session.commit()
-    return offering
-
-@pytest.fixture
-def program(department, _db):
-    """Create a test program."""
-    program = Program(
+    )),
+    ("program", dict(
         name="Computer Science BSc",
         degree_awarded="Bachelor of Science",
         duration=3,
-        department=department,
-        course_requirements="120 credits minimum",
-        enrollment_details="September intake"
-    )
-    _db.session.add(program)
-    _db.session.commit()
-    return program
-
-@pytest.fixture
-def student(program, lecturer, _db):
-    """Create a test student."""
-    student = Student(
+        course_requirements="120 credits minimum"
+    )),
+    ("student", dict(
         name="John Doe",
         email="john.doe@student.uni.ac.uk",
-        date_of_birth=date(2000, 1, 15),
         year_of_study=2,
-        current_grades=75.5,
-        enrolled_program_id=program.program_id,
-        advisor=lecturer,
-        graduation_status=False,
-        disciplinary_record=False
-    )
-    _db.session.add(student)
-    _db.session.commit()
-    return student
-
-@pytest.fixture
-def enrollment(student, course_offering, _db):
-    """Create a test enrollment."""
-    enrollment = Enrollment(
-        student=student,
-        offering=course_offering,
-        enrollment_date=date(2024, 9, 1),
-        grade=85.0,
-        status="completed"
-    )
-    _db.session.add(enrollment)
-    _db.session.commit()
-    return enrollment
-
-@pytest.fixture
-def staff(department, _db):
-    """Create a test non-academic staff member."""
-    staff = NonAcademicStaff(
+        graduation_status=False
+    )),
+    ("staff", dict(
         name="Sarah Wilson",
         job_title="Department Administrator",
-        employment_type="Full-Time",
-        department=department
-    )
-    _db.session.add(staff)
-    _db.session.commit()
-    return staff
-
-@pytest.fixture
-def research_project(lecturer, _db):
-    """Create a test research project."""
-    project = ResearchProject(
+        employment_type="Full-Time"
+    )),
+    ("research_project", dict(
         title="Advanced Machine Learning Techniques",
         funding_sources="UK Research Council;EPSRC",
-        principal_investigator=lecturer,
-        outcomes="New ML framework;3 publications;Patent application",
-        publications="Smith, A. et al. (2024). Novel ML Approaches. Nature AI."
-    )
-    project.team_members = [lecturer]
-    _db.session.add(project)
-    _db.session.commit()
-    return project
+        outcomes="New ML framework;3 publications;Patent application"
+    )),
+])
+def test_creation(request, obj_fixture, expected):
+    """Test model creation and basic attributes."""
+    obj = request.getfixturevalue(obj_fixture)
+    assert {field: getattr(obj, field) for field in expected} == expected
 
 
 # ===============================
 # Test Department Model
 # ===============================
 
-def test_department_creation(department):
-    """Test department creation and basic attributes."""
-    assert department.name == "Computer Science"
-    assert department.faculty == "Engineering"
-    assert "Artificial Intelligence" in department.research_areas
 
 def test_department_relationships(department, lecturer, course, program, staff):
     """Test department relationships with other models."""
-    assert lecturer in department.lecturers
-    assert course in department.courses
-    assert program in department.programs
-    assert staff in department.staff_members
+    # Check the many-to-one side, which resolves from the identity map
+    # instead of loading each collection
+    assert lecturer.department is department
+    assert course.department is department
+    assert program.department is department
+    assert staff.department is department
 
 def test_department_to_dict(department):
     """Test department to_dict method."""
@@ -193,7 +88,7 @@ def test_department_to_dict(department):
 
 def test_department_research_areas_property(department):
     """Test department research_areas property returns list."""
-    research_areas = [area.strip() for area in department.research_areas.split(';') if area.strip()]
+    research_areas = department.research_areas_list
     assert isinstance(research_areas, list)
     assert "Artificial Intelligence" in research_areas
     assert "Cybersecurity" in research_areas
@@ -203,12 +98,6 @@ def test_department_research_areas_property(department):
 # Test Lecturer Model
 # ===============================
 
-def test_lecturer_creation(lecturer):
-    """Test lecturer creation and basic attributes."""
-    assert lecturer.name == "Dr. Alice Smith"
-    assert lecturer.email == "a.smith@uni.ac.uk"
-    assert lecturer.employment_type == "Full-Time"
-    assert lecturer.course_load == 2
 
 def test_lecturer_relationships(lecturer, course_offering, student, research_project):
     """Test lecturer relationships with other models."""
@@ -226,7 +115,7 @@ def test_lecturer_to_dict(lecturer):
 
 def test_lecturer_expertise_areas_property(lecturer):
     """Test lecturer areas_of_expertise property returns list."""
-    expertise = [area.strip() for area in lecturer.areas_of_expertise.split(';') if area.strip()] if lecturer.areas_of_expertise else []
+    expertise = lecturer.areas_of_expertise_list
     assert isinstance(expertise, list)
     assert "AI" in expertise
     assert "Machine Learning" in expertise
@@ -241,12 +130,6 @@ def test_lecturer_current_course_load(lecturer, course_offering):
 # Test Course Model
 # ===============================
 
-def test_course_creation(course):
-    """Test course creation and basic attributes."""
-    assert course.code == "CS101"
-    assert course.name == "Introduction to Programming"
-    assert course.credits == 15
-    assert course.schedule == "Mon 10:00-12:00, Wed 14:00-16:00"
 
 def test_course_relationships(course, course_offering, enrollment):
     """Test course relationships with other models."""
@@ -264,8 +147,8 @@ def test_course_to_dict(course):
 
 def test_course_active_enrollments_property(course, enrollment):
     """Test course active_enrollments property."""
+    # The property filters the loaded enrollments in Python, so the change needs no flush
     enrollment.status = 'active'
-    db.session.commit()
     
     active_enrollments = course.active_enrollments
     assert len(active_enrollments) >= 1
@@ -300,12 +183,6 @@ def test_course_offering_to_dict(course_offering):
 # Test Program Model
 # ===============================
 
-def test_program_creation(program):
-    """Test program creation and basic attributes."""
-    assert program.name == "Computer Science BSc"
-    assert program.degree_awarded == "Bachelor of Science"
-    assert program.duration == 3
-    assert program.course_requirements == "120 credits minimum"
 
 def test_program_relationships(program, student):
     """Test program relationships with other models."""
@@ -331,13 +208,6 @@ def test_program_students_property(program, student):
 # Test Student Model
 # ===============================
 
-def test_student_creation(student, program):
-    """Test student creation and basic attributes."""
-    assert student.name == "John Doe"
-    assert student.email == "john.doe@student.uni.ac.uk"
-    assert student.year_of_study == 2
-    assert student.enrolled_program_id == program.program_id
-    assert student.graduation_status == False
 
 def test_student_relationships(student, lecturer, enrollment):
     """Test student relationships with other models."""
@@ -353,26 +223,12 @@ def test_student_to_dict(student):
 
 def test_student_active_courses_property(student, enrollment):
     """Test student active_courses property."""
+    # The property filters the loaded enrollments in Python, so the change needs no flush
     enrollment.status = 'active'
-    db.session.commit()
     
     active_courses = student.active_courses
     assert len(active_courses) >= 1
 
-def test_student_grade_constraint(_db):
-    """Test student year_of_study constraint."""
-    with pytest.raises(Exception):  # SQLAlchemy will raise an exception for constraint violation
-        invalid_student = Student(
-            name="Invalid Student",
-            email="invalid@student.uni.ac.uk",
-            date_of_birth=date(2000, 1, 15),
-            year_of_study=11,  # Invalid year (> 10)
-            current_grades=75.5
-        )
-        _db.session.add(invalid_student)
-        _db.session.commit()
-
-
 # ===============================
 # Test Enrollment Model
 # ===============================
@@ -398,11 +254,6 @@ def test_enrollment_to_dict(enrollment):
 # Test NonAcademicStaff Model
 # ===============================
 
-def test_staff_creation(staff):
-    """Test non-academic staff creation and basic attributes."""
-    assert staff.name == "Sarah Wilson"
-    assert staff.job_title == "Department Administrator"
-    assert staff.employment_type == "Full-Time"
 
 def test_staff_relationships(staff, department):
     """Test non-academic staff relationships with other models."""
@@ -421,11 +272,6 @@ def test_staff_to_dict(staff):
 # Test ResearchProject Model
 # ===============================
 
-def test_research_project_creation(research_project):
-    """Test research project creation and basic attributes."""
-    assert research_project.title == "Advanced Machine Learning Techniques"
-    assert "UK Research Council" in research_project.funding_sources
-    assert "New ML framework" in research_project.outcomes
 
 def test_research_project_relationships(research_project, lecturer):
     """Test research project relationships with other models."""
@@ -443,7 +289,7 @@ def test_research_project_properties(research_project):
     """Test research project computed properties."""
     assert research_project.team_size >= 1
     assert isinstance(research_project.outcome_list, list)
-    funding_sources = research_project.funding_sources.split(';') if research_project.funding_sources else []
+    funding_sources = research_project.funding_sources_list
     assert isinstance(funding_sources, list)
     assert len(funding_sources) > 0
 
@@ -452,106 +298,90 @@ def test_research_project_properties(research_project):
 # Test Model Constraints and Validations
 # ===============================
 
-def test_unique_constraints(_db, department):
-    """Test unique constraints on models."""
-    # Test department name uniqueness
-    with pytest.raises(Exception):
-        duplicate_dept = Department(
-            name="Computer Science",  # Duplicate name
-            faculty="Science",
-            research_areas="Data Science"
-        )
-        _db.session.add(duplicate_dept)
-        _db.session.commit()
-
-def test_email_uniqueness(_db, lecturer):
-    """Test email uniqueness constraint."""
-    with pytest.raises(Exception):
-        duplicate_lecturer = Lecturer(
-            name="Another Lecturer",
-            email="a.smith@uni.ac.uk",  # Duplicate email
-            academic_qualifications="PhD",
-            employment_type="Part-Time"
-        )
-        _db.session.add(duplicate_lecturer)
-        _db.session.commit()
-
-def test_course_code_uniqueness(_db, course):
-    """Test course code uniqueness constraint."""
-    with pytest.raises(Exception):
-        duplicate_course = Course(
-            code="CS101",  # Duplicate code
-            name="Another Programming Course",
-            description="Another course",
-            level="Undergraduate",
-            credits=15
-        )
-        _db.session.add(duplicate_course)
-        _db.session.commit()
+@pytest.mark.parametrize("model,fields", [
+    (Department, dict(
+        name="Computer Science",  # Duplicate name
+        faculty="Science",
+        research_areas="Data Science"
+    )),
+    (Lecturer, dict(
+        name="Another Lecturer",
+        email="a.smith@uni.ac.uk",  # Duplicate email
+        academic_qualifications="PhD",
+        employment_type="Part-Time"
+    )),
+    (Course, dict(
+        code="CS101",  # Duplicate code
+        name="Another Programming Course",
+        description="Another course",
+        level="Undergraduate",
+        credits=15
+    )),
+    (Student, dict(
+        name="Invalid Student",
+        email="invalid@student.uni.ac.uk",
+        date_of_birth=date(2000, 1, 15),
+        year_of_study=11,  # Invalid year (> 5)
+        current_grades=75.5
+    )),
+    (Enrollment, dict(
+        student_id=-1,  # No such student
+        offering_id=-1,  # No such offering
+        enrollment_date=date(2024, 9, 1),
+        status="active"
+    )),
+], ids=["department_name", "lecturer_email", "course_code", "student_year_of_study",
+        "enrollment_foreign_keys"])
+def test_constraint_violations(_db, seed_data, model, fields):
+    """Test unique, check and foreign key constraints reject invalid rows."""
+    try:
+        with pytest.raises(IntegrityError):
+            _db.session.add(model(**fields))
+            _db.session.flush()
+    finally:
+        _db.session.rollback()
 
 
 # ===============================
 # Test Cascade Deletions
 # ===============================
 
-def test_department_cascade_delete(_db, department, lecturer, course, program, staff):
-    """Test that deleting a department cascades properly."""
-    dept_id = department.department_id
-    _db.session.delete(department)
-    _db.session.commit()
-
-    assert _db.session.get(Department, dept_id) is None
-    # Verify related records are updated or deleted as per relationship configuration
-    assert _db.session.get(Lecturer, lecturer.lecturer_id) is not None  # Should still exist
-    assert _db.session.get(Course, course.course_id) is not None  # Should still exist
-    assert _db.session.get(Program, program.program_id) is not None  # Should still exist
-
-def test_course_offering_cascade_delete(_db, course_offering, enrollment):
-    """Test that deleting a course offering cascades to enrollments."""
-    from sqlalchemy.exc import IntegrityError
-    
-    offering_id = course_offering.offering_id
-    enrollment_id = enrollment.enrollment_id
-    
-    try:
-        _db.session.delete(course_offering)
-        _db.session.commit()
-        # If we reach here, cascade delete worked properly
-        assert _db.session.get(CourseOffering, offering_id) is None
-        # Check if enrollment is also deleted (depends on cascade configuration)
-        enrollment_still_exists = _db.session.get(Enrollment, enrollment_id) is not None
-        
-    except IntegrityError:
-        # Expected behavior: cascade delete is not properly configured
-        _db.session.rollback()
-        # Verify objects still exist after rollback
-        assert _db.session.get(CourseOffering, offering_id) is not None
-        assert _db.session.get(Enrollment, enrollment_id) is not None
-        # This indicates the model needs cascade='all, delete-orphan' on the relationship
-        pass
-
-def test_student_cascade_delete(_db, student, enrollment):
-    """Test that deleting a student handles related enrollments properly."""
-    from sqlalchemy.exc import IntegrityError
-    
-    student_id = student.student_id
-    enrollment_id = enrollment.enrollment_id
-    
-    try:
-        _db.session.delete(student)
-        _db.session.commit()
-        # If successful, verify deletion
-        assert _db.session.get(Student, student_id) is None
-        
-    except IntegrityError:
-        _db.session.rollback()
-        # Delete enrollment first, then student
-        _db.session.delete(enrollment)
-        _db.session.delete(student)
-        _db.session.commit()
-        # Verify both are deleted
-        assert _db.session.get(Student, student_id) is None
-        assert _db.session.get(Enrollment, enrollment_id) is None
+def _primary_key(obj):
+    pk_column, = sa_inspect(type(obj)).primary_key
+    return pk_column, sa_inspect(obj).identity[0]
+
+def _exist(session, primary_keys):
+    """Map each name to whether its row exists, checked with EXISTS in one round trip."""
+    row = session.execute(select(*(
+        select(pk_column).where(pk_column == pk).exists()
+        for pk_column, pk in primary_keys.values()
+    ))).one()
+    return dict(zip(primary_keys, map(bool, row)))
+
+@pytest.mark.parametrize("target,cascaded,survivors", [
+    ("department", [], ["lecturer", "course", "program", "staff"]),
+    ("course_offering", ["enrollment"], []),
+    ("student", ["enrollment"], []),
+], ids=["department", "course_offering", "student"])
+@pytest.mark.parametrize("via", ["orm", "database"])
+def test_cascade_delete(db_session, request, target, cascaded, survivors, via):
+    """Test that deleting a record removes its dependents and keeps its other relations."""
+    parent = request.getfixturevalue(target)
+    primary_keys = {name: _primary_key(request.getfixturevalue(name))
+                    for name in [target, *cascaded, *survivors]}
+    pk_column, pk = primary_keys[target]
+
+    # The checks below query the database, so a flush is enough; nothing needs committing
+    if via == "orm":
+        # The session applies the relationship cascades itself
+        db_session.delete(parent)
+        db_session.flush()
+    else:
+        # A single DELETE; the database applies the ON DELETE rules to the child rows
+        db_session.query(type(parent)).filter(pk_column == pk).delete(synchronize_session=False)
+
+    expected = {name: name in survivors for name in primary_keys}
+    assert _exist(db_session, primary_keys) == expected
 
 
 # ===============================
@@ -561,12 +391,12 @@ def test_student_cascade_delete(_db, student, enrollment):
 def test_semicolon_separated_properties(lecturer, research_project):
     """Test that semicolon-separated fields are properly converted to lists."""
     # Test lecturer properties
-    research_interests = [ri.strip() for ri in lecturer.research_interests.split(';')] if lecturer.research_interests else []
-    areas_of_expertise = [ae.strip() for ae in lecturer.areas_of_expertise.split(';')] if lecturer.areas_of_expertise else []
-    publications = [pub.strip() for pub in lecturer.publications.split(';')] if lecturer.publications else []
+    research_interests = lecturer.research_interests_list
+    areas_of_expertise = lecturer.areas_of_expertise_list
+    publications = lecturer.publications_list
 
     # Test research project properties
-    funding_sources = [fs.strip() for fs in research_project.funding_sources.split(';')] if research_project.funding_sources else []
+    funding_sources = research_project.funding_sources_list
     outcomes = research_project.outcome_list
 
     assert isinstance(research_interests, list)
@@ -587,21 +417,28 @@ def test_semicolon_separated_properties(lecturer, research_project):
     assert "UK Research Council" in funding_sources
     assert "New ML framework" in outcomes
 
+# Probed on the classes: hasattr on an instance would run the property (and any
+# query behind it) just to find out whether it exists
+_STUDENT_HAS_GPA = hasattr(Student, 'calculate_gpa')
+_COURSE_HAS_STUDENT_COUNT = hasattr(Course, 'student_count')
+_LECTURER_HAS_COURSE_LOAD = hasattr(Lecturer, 'current_course_load')
+_NUMERIC_T = (int, float)
+
 def test_calculated_properties(student, enrollment, course, lecturer):
     """Test calculated properties across models."""
     # Test student GPA calculation (if implemented)
-    if hasattr(student, 'calculate_gpa'):
+    if _STUDENT_HAS_GPA:
         gpa = student.calculate_gpa()
-        assert isinstance(gpa, (int, float))
+        assert isinstance(gpa, _NUMERIC_T)
     
     # Test course student count
-    if hasattr(course, 'student_count'):
+    if _COURSE_HAS_STUDENT_COUNT:
         count = course.student_count
         assert isinstance(count, int)
         assert count >= 0
     
     # Test lecturer course load
-    if hasattr(lecturer, 'current_course_load'):
+    if _LECTURER_HAS_COURSE_LOAD:
         load = lecturer.current_course_load
         assert isinstance(load, int)
         assert load >= 0